@@ -0,0 +1,188 @@
+"""
+Almacén persistente de resultados de NICSPECTRA.
+
+Guarda en disco (SQLite) los resultados ya calculados: espectros, tablas de
+viento e imágenes/reportes PNG/PDF. Cada resultado se identifica por el hash
+canónico de todas las entradas del cálculo, de modo que un caso repetido
+(p. ej. Managua, Suelo D, Grupo C) se sirve sin recalcular, aun entre usuarios
+distintos y después de reiniciar el servidor.
+"""
+import hashlib
+import io
+import json
+import os
+import sqlite3
+import threading
+import time
+
+import numpy as np
+
+# ----------------------------------------------------------------------------
+# CONFIGURACIÓN
+# ----------------------------------------------------------------------------
+RUTA_ALMACEN = os.environ.get(
+    "NICSPECTRA_ALMACEN",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), ".nicspectra_cache", "resultados.sqlite")
+)
+TAMANO_MAXIMO = int(float(os.environ.get("NICSPECTRA_ALMACEN_MB", "512")) * 1024 * 1024)
+TIEMPO_ESPERA = 30.0  # segundos de espera si otro proceso tiene el bloqueo
+# Un acierto solo actualiza ultimo_acceso si la marca es más vieja que esto
+# (segundos): la lectura no toma el bloqueo de escritura en cada consulta
+REFRESCO_ACCESO = 300.0
+# Cambiar al modificar fórmulas, tablas, gráficos o reportes: invalida lo guardado
+VERSION_ALMACEN = 2
+
+_ESQUEMA = """
+CREATE TABLE IF NOT EXISTS resultados (
+    clave TEXT NOT NULL,
+    tipo TEXT NOT NULL,
+    datos BLOB NOT NULL,
+    tamano INTEGER NOT NULL,
+    ultimo_acceso REAL NOT NULL,
+    PRIMARY KEY (clave, tipo)
+);
+CREATE INDEX IF NOT EXISTS idx_resultados_acceso ON resultados (ultimo_acceso);
+"""
+
+
+# ----------------------------------------------------------------------------
+# 1. CLAVE CANÓNICA
+# ----------------------------------------------------------------------------
+def _canonico(valor):
+    """Convierte tipos de numpy a tipos nativos para serializar a JSON."""
+    if isinstance(valor, np.generic):
+        return valor.item()
+    if isinstance(valor, np.ndarray):
+        return valor.tolist()
+    raise TypeError(f"Tipo no serializable en la clave: {type(valor).__name__}")
+
+
+def clave_resultado(entradas):
+    """
+    Calcula la clave (SHA-256) de un cálculo a partir de sus entradas y de
+    VERSION_ALMACEN. El orden de las llaves del diccionario no afecta el resultado.
+    """
+    entradas = {"_version": VERSION_ALMACEN, "entradas": entradas}
+    texto = json.dumps(entradas, sort_keys=True, separators=(",", ":"), default=_canonico)
+    return hashlib.sha256(texto.encode("utf-8")).hexdigest()
+
+
+# ----------------------------------------------------------------------------
+# 2. ACCESO A LA BASE DE DATOS
+# ----------------------------------------------------------------------------
+# Una conexión por proceso, compartida entre los hilos de Streamlit
+_conexion = None
+_ruta_conexion = None
+_bloqueo = threading.RLock()
+
+
+def _conectar():
+    """
+    Devuelve la conexión del proceso; el esquema y los PRAGMA se aplican solo
+    al abrirla. Usar siempre dentro de `with _bloqueo`.
+    """
+    global _conexion, _ruta_conexion
+    if _conexion is not None and _ruta_conexion == RUTA_ALMACEN:
+        return _conexion
+    if _conexion is not None:
+        _conexion.close()
+        _conexion = None
+
+    os.makedirs(os.path.dirname(RUTA_ALMACEN), exist_ok=True)
+    con = sqlite3.connect(RUTA_ALMACEN, timeout=TIEMPO_ESPERA, isolation_level=None,
+                          check_same_thread=False)
+    try:
+        # WAL permite lecturas concurrentes mientras otro proceso escribe
+        con.execute("PRAGMA journal_mode=WAL")
+        con.execute("PRAGMA synchronous=NORMAL")
+        con.executescript(_ESQUEMA)
+    except sqlite3.Error:
+        con.close()
+        raise
+    _conexion, _ruta_conexion = con, RUTA_ALMACEN
+    return con
+
+
+def obtener(clave, tipo):
+    """Devuelve los bytes guardados para (clave, tipo) o None si no existen."""
+    try:
+        with _bloqueo:
+            con = _conectar()
+            fila = con.execute(
+                "SELECT datos, ultimo_acceso FROM resultados WHERE clave = ? AND tipo = ?", (clave, tipo)
+            ).fetchone()
+            if fila is None:
+                return None
+            ahora = time.time()
+            if ahora - fila[1] > REFRESCO_ACCESO:
+                con.execute(
+                    "UPDATE resultados SET ultimo_acceso = ? WHERE clave = ? AND tipo = ?",
+                    (ahora, clave, tipo)
+                )
+            return bytes(fila[0])
+    except (sqlite3.Error, OSError):
+        return None
+
+
+def guardar(clave, tipo, datos):
+    """
+    Guarda los bytes de un resultado y, si el almacén supera TAMANO_MAXIMO,
+    elimina los resultados usados menos recientemente (LRU).
+    """
+    try:
+        with _bloqueo:
+            con = _conectar()
+            try:
+                con.execute("BEGIN IMMEDIATE")
+                con.execute(
+                    "INSERT OR REPLACE INTO resultados (clave, tipo, datos, tamano, ultimo_acceso) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (clave, tipo, sqlite3.Binary(datos), len(datos), time.time())
+                )
+                # Se conservan los más recientes mientras el acumulado quepa en el límite
+                con.execute(
+                    "DELETE FROM resultados WHERE rowid IN ("
+                    "  SELECT rowid FROM ("
+                    "    SELECT rowid, SUM(tamano) OVER (ORDER BY ultimo_acceso DESC, rowid DESC) AS acumulado"
+                    "    FROM resultados"
+                    "  ) WHERE acumulado > ?"
+                    ")",
+                    (TAMANO_MAXIMO,)
+                )
+                con.execute("COMMIT")
+            except sqlite3.Error:
+                if con.in_transaction:
+                    con.execute("ROLLBACK")
+                raise
+    except (sqlite3.Error, OSError):
+        # El almacén es solo una optimización: si falla, la app sigue calculando
+        pass
+
+
+# ----------------------------------------------------------------------------
+# 3. FORMATOS (arreglos y tablas)
+# ----------------------------------------------------------------------------
+def obtener_arrays(clave, tipo):
+    """Devuelve un diccionario {nombre: np.ndarray} o None."""
+    datos = obtener(clave, tipo)
+    if datos is None:
+        return None
+    with np.load(io.BytesIO(datos), allow_pickle=False) as npz:
+        return {k: npz[k] for k in npz.files}
+
+
+def guardar_arrays(clave, tipo, **arrays):
+    buf = io.BytesIO()
+    np.savez_compressed(buf, **{k: np.asarray(v) for k, v in arrays.items()})
+    guardar(clave, tipo, buf.getvalue())
+
+
+def obtener_json(clave, tipo):
+    datos = obtener(clave, tipo)
+    if datos is None:
+        return None
+    return json.loads(datos.decode("utf-8"))
+
+
+def guardar_json(clave, tipo, valor):
+    guardar(clave, tipo, json.dumps(valor, default=_canonico).encode("utf-8"))
@@ -0,0 +1,64 @@
+"""
+Benchmark del tiempo de arranque de cada módulo de NICSPECTRA.
+
+Cada repetición corre en un intérprete nuevo (arranque en frío). Streamlit se
+importa antes de medir, igual que en la app, de modo que el tiempo reportado
+es solo el costo propio del módulo y sus dependencias. La fila "Monolítico"
+reproduce las importaciones que hacía nicspectra.py antes de separar los
+módulos, como referencia.
+
+Requiere streamlit y el resto de requirements.txt instalados: los módulos
+importan streamlit al cargarse.
+
+Uso:
+    python benchmark_inicio.py [repeticiones]
+"""
+import os
+import statistics
+import subprocess
+import sys
+
+MODULOS = {
+    "Monolítico": "numpy, pandas, matplotlib.pyplot, folium, streamlit_folium, unicodedata, fpdf",
+    "Sismo (NSM-22)": "modulo_sismo",
+    "Viento (RNC-07)": "modulo_viento",
+}
+DEPENDENCIAS_PESADAS = ["folium", "streamlit_folium", "matplotlib", "fpdf"]
+
+_CODIGO = (
+    "import streamlit, sys, time\n"
+    "t0 = time.perf_counter()\n"
+    "import {modulo}\n"
+    "dt = time.perf_counter() - t0\n"
+    "cargadas = [d for d in {pesadas!r} if d in sys.modules]\n"
+    "print(dt, ','.join(cargadas))\n"
+)
+
+
+def medir_modulo(modulo, repeticiones):
+    """Devuelve (tiempos en s, dependencias pesadas cargadas) de importar el módulo."""
+    directorio = os.path.dirname(os.path.abspath(__file__))
+    codigo = _CODIGO.format(modulo=modulo, pesadas=DEPENDENCIAS_PESADAS)
+    tiempos, cargadas = [], ""
+    for _ in range(repeticiones):
+        salida = subprocess.run(
+            [sys.executable, "-c", codigo], cwd=directorio,
+            capture_output=True, text=True, check=True
+        ).stdout.strip().splitlines()[-1]
+        dt, _, cargadas = salida.partition(" ")
+        tiempos.append(float(dt))
+    return tiempos, cargadas
+
+
+def main():
+    repeticiones = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    print(f"Arranque en frío por módulo ({repeticiones} repeticiones)")
+    print(f"{'Módulo':<18}{'Mediana (ms)':>14}{'Mín (ms)':>10}{'Máx (ms)':>10}  Dependencias pesadas")
+    for nombre, modulo in MODULOS.items():
+        tiempos, cargadas = medir_modulo(modulo, repeticiones)
+        print(f"{nombre:<18}{statistics.median(tiempos) * 1000:>14.1f}"
+              f"{min(tiempos) * 1000:>10.1f}{max(tiempos) * 1000:>10.1f}  {cargadas or '-'}")
+
+
+if __name__ == "__main__":
+    main()
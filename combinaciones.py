@@ -0,0 +1,114 @@
+"""
+Combinaciones de carga por piso (RNC-07 / NSM-22).
+
+Cada caso de carga actúa en una sola componente: las cargas gravitacionales
+producen carga axial acumulada (P) y el viento cortante de entrepiso en X o en
+Y (Vx, Vy). Los efectos de cada piso se ordenan en un arreglo
+(pisos, componentes, casos) y las combinaciones en una matriz de factores
+(combinaciones x casos). Un solo producto matricial da, para todos los pisos y
+edificios, un vector (P, Vx, Vy) por combinación; las envolventes y la
+combinación que gobierna se reportan por componente.
+"""
+import numpy as np
+
+# ----------------------------------------------------------------------------
+# CONSTANTES
+# ----------------------------------------------------------------------------
+# CM: carga muerta, CV: carga viva de entrepiso, CVR: carga viva de techo,
+# Ccv: ceniza volcánica (techo), Wx/Wy: fuerzas de viento por piso
+CASOS = ["CM", "CV", "CVR", "Ccv", "Wx", "Wy"]
+
+# Componente en la que actúa cada caso
+COMPONENTES = ["P", "Vx", "Vy"]
+COMPONENTE_CASO = {"CM": "P", "CV": "P", "CVR": "P", "Ccv": "P", "Wx": "Vx", "Wy": "Vy"}
+
+# Combinaciones de diseño por resistencia. "Lr" se reemplaza por la carga de
+# techo que corresponda (CVR o Ccv) y "W" por el viento en ambas direcciones
+# (Wx, Wy) y con ambos signos.
+_COMBINACIONES_BASE = [
+    {"CM": 1.4},
+    {"CM": 1.2, "CV": 1.6, "Lr": 0.5},
+    {"CM": 1.2, "Lr": 1.6, "CV": 1.0},
+    {"CM": 1.2, "Lr": 1.6, "W": 0.8},
+    {"CM": 1.2, "W": 1.6, "CV": 1.0, "Lr": 0.5},
+    {"CM": 0.9, "W": 1.6},
+]
+
+
+# ----------------------------------------------------------------------------
+# 1. MATRIZ DE COMBINACIONES
+# ----------------------------------------------------------------------------
+def _nombre(factores):
+    partes = []
+    for caso, f in factores.items():
+        signo = "-" if f < 0 else "+"
+        coef = "" if abs(f) == 1 else f"{abs(f):g}"
+        partes.append(f"{signo}{coef}{caso}")
+    return "".join(partes).lstrip("+")
+
+
+def _expandir(base, clave, alternativas):
+    if clave not in base:
+        return [base]
+    filas = []
+    for caso, signo in alternativas:
+        fila = {}
+        for k, v in base.items():
+            if k == clave:
+                fila[caso] = signo * v
+            else:
+                fila[k] = v
+        filas.append(fila)
+    return filas
+
+
+def matriz_combinaciones(casos=CASOS):
+    """Devuelve (nombres, matriz) con la matriz de factores (n_comb, n_casos)."""
+    filas = []
+    for base in _COMBINACIONES_BASE:
+        for fila in _expandir(base, "Lr", [("CVR", 1), ("Ccv", 1)]):
+            filas.extend(_expandir(fila, "W", [("Wx", 1), ("Wx", -1), ("Wy", 1), ("Wy", -1)]))
+
+    nombres = [_nombre(f) for f in filas]
+    matriz = np.array([[f.get(c, 0.0) for c in casos] for f in filas])
+    return nombres, matriz
+
+
+# ----------------------------------------------------------------------------
+# 2. MOTOR DE COMBINACIÓN
+# ----------------------------------------------------------------------------
+def efectos_por_componente(cargas, casos=CASOS):
+    """
+    Convierte cargas por piso en efectos de entrepiso por componente.
+
+    cargas: arreglo (..., n_pisos, n_casos) ordenado del piso 1 al techo, con
+    pesos (Ton) para los casos gravitacionales y fuerzas laterales (Ton) para
+    el viento. Cada efecto es la suma de las cargas del piso y los superiores
+    (carga axial y cortante de entrepiso). Devuelve (..., n_pisos, n_comp, n_casos),
+    con ceros donde el caso no actúa en la componente.
+    """
+    cargas = np.asarray(cargas, dtype=float)
+    acumuladas = np.flip(np.cumsum(np.flip(cargas, axis=-2), axis=-2), axis=-2)
+    mascara = np.array([[COMPONENTE_CASO[c] == comp for c in casos] for comp in COMPONENTES], dtype=float)
+    return acumuladas[..., None, :] * mascara
+
+
+def combinar_cargas(efectos, matriz):
+    """
+    Efectos combinados.
+
+    efectos: arreglo (..., n_casos); las dimensiones iniciales permiten procesar
+    pisos, componentes y varios edificios a la vez (rellenar con ceros los
+    pisos faltantes). matriz: arreglo (n_comb, n_casos).
+    Devuelve un arreglo (..., n_comb).
+    """
+    return np.asarray(efectos, dtype=float) @ np.asarray(matriz, dtype=float).T
+
+
+def envolventes(combinadas):
+    """Devuelve (maximo, minimo, idx_max, idx_min) sobre las combinaciones (último eje)."""
+    idx_max = np.argmax(combinadas, axis=-1)
+    idx_min = np.argmin(combinadas, axis=-1)
+    maximo = np.take_along_axis(combinadas, idx_max[..., None], axis=-1)[..., 0]
+    minimo = np.take_along_axis(combinadas, idx_min[..., None], axis=-1)[..., 0]
+    return maximo, minimo, idx_max, idx_min
@@ -0,0 +1,760 @@
+"""
+Módulo de Sismo (NSM-22) de NICSPECTRA.
+
+Se importa la primera vez que el usuario abre la página de sismo; aquí se
+cargan folium, matplotlib y las tablas de Excel. El generador de PDF (fpdf)
+se importa solo al descargar el reporte.
+"""
+import streamlit as st
+import numpy as np
+import pandas as pd
+import matplotlib.pyplot as plt
+import folium
+from streamlit_folium import st_folium
+import unicodedata
+import functools
+from datetime import datetime
+
+# --- Almacén persistente de resultados ---
+import almacen
+
+# ----------------------------------------------------------------------------
+# 1. CARGA DE DATOS
+# ----------------------------------------------------------------------------
+@st.cache_data
+def load_data():
+    try:
+        read_params = {'header': 0, 'skiprows': [1]}
+        data = {
+            "Aceleracion_table": pd.read_excel('Aceleraciones.xlsx'),
+            "Vs30_table": pd.read_excel('Vs30.xlsx'),
+            "MurosDeCarga": pd.read_excel('SistemasDeMurosDeCarga.xlsx', **read_params),
+            "MurosEstructurales": pd.read_excel('SistemasDeMurosEstructuralesYMarcosArriostrados.xlsx', **read_params),
+            "MarcosAMomento": pd.read_excel('SistemasDeMarcosAMomento.xlsx', **read_params),
+            "DualesEspeciales": pd.read_excel('SistemasDualesConMarcosDeMomentosEspecialesCapazDeResistirAlMenosEl25DeLasFuerzasSismicasPrescritas.xlsx', **read_params),
+            "DualesIntermedios": pd.read_excel('SistemasDualesConMarcosDeMomentoIntermedioCapazDeResistirAlMenosEl25DeLasFuerzasSismicasPrescritas.xlsx', **read_params),
+            "ColumnasEnVoladizo": pd.read_excel('SistemasDeColumnaEnVoladizoYSistemasDeAceroNoDetalladosEspecificamenteParaResistenciaSismica.xlsx', **read_params),
+        }
+        return data
+    except Exception as e:
+        st.error(f"Error al cargar archivos Excel: {e}")
+        return None
+
+
+# ----------------------------------------------------------------------------
+# 2. FUNCIONES DE CÁLCULO
+# ----------------------------------------------------------------------------
+def obtener_zona_sismica(a0):
+    if a0 >= 0.315: return "Z4"
+    elif 0.23 <= a0 < 0.315: return "Z3"
+    elif 0.17 <= a0 < 0.23: return "Z2"
+    else: return "Z1"
+
+def clasificar_suelo(vs30):
+    if vs30 > 1500: return "A"
+    elif 760 < vs30 <= 1500: return "B"
+    elif 360 < vs30 <= 760: return "C"
+    elif 180 <= vs30 <= 360: return "D"
+    else: return "E"
+
+def obtener_cds(a0, grupo_str):
+    es_riesgo_alto = "IV" in grupo_str or "III" in grupo_str
+    
+    if a0 >= 0.30:
+        return "D" 
+    elif 0.15 <= a0 < 0.30:
+        return "D" if es_riesgo_alto else "C"
+    elif 0.10 <= a0 < 0.15:
+        return "C" if es_riesgo_alto else "B"
+    else:
+        return "B" if es_riesgo_alto else "A"
+
+def obtener_Fas(zona, tipo_suelo):
+    tabla_Fas = {
+        "Z1": {"A": 0.8, "B": 1.0, "C": 1.4, "D": 1.7, "E": 2.2},
+        "Z2": {"A": 0.8, "B": 1.0, "C": 1.4, "D": 1.6, "E": 2.0},
+        "Z3": {"A": 0.8, "B": 1.0, "C": 1.4, "D": 1.5, "E": 2.4}, 
+        "Z4": {"A": 0.8, "B": 1.0, "C": 1.3, "D": 1.4, "E": 2.4}  
+    }
+    return tabla_Fas.get(zona, {}).get(tipo_suelo, 1.0)
+
+def obtener_factores_ajuste_espectral(tipo_suelo):
+    if tipo_suelo == "A": return (1.0, 5/6)
+    elif tipo_suelo == "B": return (1.0, 1.0)
+    elif tipo_suelo == "C": return (1.0, 4/3)
+    elif tipo_suelo == "D": return (2.0, 5/3)
+    else: return (2.0, 5/3)
+
+# --- Ceniza  ---
+def normalizar_texto(texto):
+    """Elimina acentos y convierte a mayúsculas para comparación."""
+    if not isinstance(texto, str):
+        return ""
+    texto = texto.upper().strip()
+    return ''.join(
+        c for c in unicodedata.normalize('NFD', texto)
+        if unicodedata.category(c) != 'Mn'
+    )
+
+def calcular_carga_ceniza(ubicacion):
+    """
+    Calcula la carga por ceniza volcánica según NSM-22.
+    Busca si la ubicación corresponde a un departamento de riesgo o uno de sus municipios.
+    """
+    # Base de datos de Departamentos de Riesgo y sus Municipios
+    mapa_riesgo_ceniza = {
+        'CHINANDEGA': [
+            'CHINANDEGA', 'CHICHIGALPA', 'CORINTO', 'EL REALEJO', 'EL VIEJO', 
+            'POSOLTEGA', 'PUERTO MORAZAN', 'SAN FRANCISCO DEL NORTE', 
+            'SAN PEDRO DEL NORTE', 'SANTO TOMAS DEL NORTE', 'SOMOTILLO', 
+            'VILLANUEVA', 'CINCO PINOS'
+        ],
+        'LEON': [
+            'LEON', 'ACHUAPA', 'EL JICARAL', 'EL SAUCE', 'LA PAZ CENTRO', 
+            'LARREYNAGA', 'MALPAISILLO', 'NAGAROTE', 'QUEZALGUAQUE', 
+            'SANTA ROSA DEL PEÑON', 'TELICA'
+        ],
+        'MANAGUA': [
+            'MANAGUA', 'CIUDAD SANDINO', 'EL CRUCERO', 'MATEARE', 
+            'SAN FRANCISCO LIBRE', 'SAN RAFAEL DEL SUR', 'TICUANTEPE', 
+            'TIPITAPA', 'VILLA EL CARMEN'
+        ],
+        'MASAYA': [
+            'MASAYA', 'CATARINA', 'LA CONCEPCION', 'LA CONCHA', 'MASATEPE', 
+            'NANDASMO', 'NINDIRI', 'NIQUINOHOMO', 'SAN JUAN DE ORIENTE', 'TISMA'
+        ],
+        'GRANADA': [
+            'GRANADA', 'DIRIA', 'DIRIOMO', 'NANDAIME'
+        ],
+        'CARAZO': [
+            'JINOTEPE', 'DIRIAMBA', 'DOLORES', 'EL ROSARIO', 'LA CONQUISTA', 
+            'LA PAZ DE CARAZO', 'SAN MARCOS', 'SANTA TERESA'
+        ],
+        'RIVAS': [ # Incluye Isla de Ometepe (Altagracia y Moyogalpa)
+            'RIVAS', 'ALTAGRACIA', 'BELEN', 'BUENOS AIRES', 'CARDENAS', 
+            'MOYOGALPA', 'POTOSI', 'SAN JORGE', 'SAN JUAN DEL SUR', 'TOLA'
+        ]
+    }
+
+    ub_norm = normalizar_texto(ubicacion)
+    es_zona_riesgo = False
+
+    for depto, municipios in mapa_riesgo_ceniza.items():
+        if ub_norm == depto:
+            es_zona_riesgo = True
+            break
+
+        for muni in municipios:
+            if ub_norm == muni:
+                es_zona_riesgo = True
+                break
+        
+        if es_zona_riesgo:
+            break
+
+    carga = 20.0 if es_zona_riesgo else 0.0
+    return carga, es_zona_riesgo
+
+
+# ----------------------------------------------------------------------------
+# 3. ESPECTRO NSM-22 Y CONSULTA DE ORDENADAS
+# ----------------------------------------------------------------------------
+TB_BASE, TC_BASE, TD_BASE = 0.05, 0.3, 2.0
+BETA, P_EXP, Q_EXP = 2.4, 0.8, 2.0
+
+GRUPO_DICT = {
+    'Grupo A: Esenciales/Críticas (IV)': 1.65,
+    'Grupo B: Ocupación Especial (III)': 1.30,
+    'Grupo C: Ocupación Normal (II)': 1.00,
+    'Grupo D: No habitacional (I)': 0.75
+}
+ZONAS = ["Z1", "Z2", "Z3", "Z4"]
+SUELOS = ["A", "B", "C", "D", "E"]
+IMPORTANCIAS = list(GRUPO_DICT.values())
+# Intervalos de R0 de la tabla; R0 = R × Φp × Φe puede quedar por debajo de 1
+R0_BUCKETS = np.round(np.arange(0.25, 8.01, 0.25), 2)
+
+def espectro_nsm22(T, A_o, T_b, T_c, T_d, R_o, beta=BETA, p=P_EXP, q=Q_EXP):
+    """
+    Ordenadas elástica y de diseño en forma cerrada para los periodos T.
+    Todos los argumentos aceptan arreglos compatibles (broadcasting).
+    Devuelve (elastico, diseno).
+    """
+    T = np.asarray(T, dtype=float)
+    t_pos = np.where(T > 0, T, 1.0)  # evita dividir entre cero en T = 0
+    meseta = A_o * beta
+    tramos = [T < T_b, T < T_c, T < T_d]
+
+    elastico = np.select(
+        tramos,
+        [A_o * (1 + (T / T_b) * (beta - 1)), meseta, meseta * (T_c / t_pos)**p],
+        meseta * (T_c / T_d)**p * (T_d / t_pos)**q
+    )
+
+    R = np.where(np.asarray(R_o) > 0, R_o, 1.0)
+    diseno = np.select(
+        tramos,
+        [(A_o * T / T_b) * ((beta / R) - 1) + A_o, meseta / R, meseta * (T_c / t_pos)**p / R],
+        meseta * (T_c / T_d)**p * (T_d / t_pos)**q / R
+    )
+    diseno = np.where(np.asarray(R_o) > 0, diseno, elastico)
+    return elastico, diseno
+
+@functools.lru_cache(maxsize=None)
+def tabla_esquinas():
+    """
+    Tabla precalculada de esquinas del espectro para cada combinación de zona,
+    tipo de suelo, factor de importancia y R0 (en intervalos de R0_BUCKETS).
+    Las mesetas se dan por unidad de a0: multiplicar por la aceleración del sitio.
+    Se construye una sola vez por proceso; no modificar el DataFrame devuelto.
+    """
+    filas = []
+    for zona in ZONAS:
+        for suelo in SUELOS:
+            F_as = obtener_Fas(zona, suelo)
+            FS_Tb, FS_Tc = obtener_factores_ajuste_espectral(suelo)
+            for I in IMPORTANCIAS:
+                for R0 in R0_BUCKETS:
+                    filas.append({
+                        "Zona": zona, "Suelo": suelo, "I": I, "R0": R0, "Fas": F_as,
+                        "T_b": FS_Tb * TB_BASE, "T_c": FS_Tc * TC_BASE, "T_d": TD_BASE,
+                        "Meseta_Elastica/a0": F_as * I * BETA,
+                        "Meseta_Diseno/a0": F_as * I * BETA / R0,
+                    })
+    return pd.DataFrame(filas)
+
+@functools.lru_cache(maxsize=None)
+def _columnas_esquinas():
+    """Columnas de tabla_esquinas() como arreglos de NumPy para indexar sin copiar el DataFrame."""
+    return {c: col.to_numpy() for c, col in tabla_esquinas().items()}
+
+def indice_escenario(zona, suelo, I, R0):
+    """
+    Índice de fila en tabla_esquinas() para arreglos de escenarios. R0 se
+    redondea hacia abajo al intervalo más cercano (lado conservador); por
+    encima del último intervalo se usa el último. Un R0 menor que el primer
+    intervalo no tiene fila conservadora y produce ValueError.
+    """
+    iz = pd.Index(ZONAS).get_indexer(np.atleast_1d(zona))
+    i_s = pd.Index(SUELOS).get_indexer(np.atleast_1d(suelo))
+    i_i = pd.Index(IMPORTANCIAS).get_indexer(np.atleast_1d(np.asarray(I, dtype=float)))
+    if (iz < 0).any() or (i_s < 0).any() or (i_i < 0).any():
+        raise ValueError("Zona, suelo o factor de importancia fuera de la tabla NSM-22.")
+    R0 = np.atleast_1d(np.asarray(R0, dtype=float))
+    if (R0 < R0_BUCKETS[0]).any():
+        raise ValueError(f"R0 menor que {R0_BUCKETS[0]}: fuera de la tabla de esquinas.")
+    i_r = np.minimum(np.searchsorted(R0_BUCKETS, R0, side="right") - 1, len(R0_BUCKETS) - 1)
+    return ((iz * len(SUELOS) + i_s) * len(IMPORTANCIAS) + i_i) * len(R0_BUCKETS) + i_r
+
+def consultar_sa(indices, T, a0):
+    """
+    Sa de diseño (g) para pares (escenario, periodo) sin generar curvas completas.
+    indices: filas de tabla_esquinas(); T: periodos (s); a0: aceleración del sitio,
+    que debe pertenecer a la zona de cada fila (Fas depende de la zona).
+    """
+    col = _columnas_esquinas()
+    indices = np.asarray(indices)
+    a0 = np.asarray(a0, dtype=float)
+
+    zonas_a0 = np.vectorize(obtener_zona_sismica, otypes=[object])(a0)
+    if (np.broadcast_to(zonas_a0, np.broadcast_shapes(a0.shape, indices.shape)) != col["Zona"][indices]).any():
+        raise ValueError("La aceleración a0 no corresponde a la zona del escenario consultado.")
+
+    A_o = a0 * col["Fas"][indices] * col["I"][indices]
+    _, diseno = espectro_nsm22(
+        T, A_o, col["T_b"][indices], col["T_c"][indices], col["T_d"][indices], col["R0"][indices]
+    )
+    return diseno
+
+
+# ============================================================================
+# PÁGINA DE SISMO
+# ============================================================================
+def app_sismo():
+    # ----------------------------------------------------------------------------
+    # CÓDIGO SISMO 
+    # ----------------------------------------------------------------------------
+    st.title("NICSPECTRA: Herramienta de Diseño Sismorresistente")
+    st.subheader("Norma Sismorresistente para la ciudad de Managua (NSM-22)")
+    st.caption("Defensa de Grado: Israel Castillo | Bryan Torres | Andres Zamora")
+    
+    data = load_data()
+    if data is None:
+        st.stop()
+
+    Aceleracion_table = data.get("Aceleracion_table")
+    Vs30_table = data.get("Vs30_table")
+
+    if 'departamento_actual' not in st.session_state:
+        st.session_state['departamento_actual'] = 'MANAGUA'
+
+    # --- 5. MAPA INTERACTIVO ---
+    if 'LATITUD' in Aceleracion_table.columns:
+        with st.container(border=True):
+            col_map, col_info = st.columns([3, 1])
+            with col_map:
+                try:
+                    dep_sel_row = Aceleracion_table[Aceleracion_table['DEPARTAMENTO'] == st.session_state['departamento_actual']].iloc[0]
+                    lat_c, lon_c = dep_sel_row['LATITUD'], dep_sel_row['LONGITUD']
+                    zoom_c = 10
+                except:
+                    lat_c, lon_c, zoom_c = 12.8, -85.5, 7
+
+                m = folium.Map(location=[lat_c, lon_c], zoom_start=zoom_c, tiles="CartoDB positron")
+                
+                fg_z4 = folium.FeatureGroup(name="Zona IV (≥ 0.315g)")
+                fg_z3 = folium.FeatureGroup(name="Zona III")
+                fg_z2 = folium.FeatureGroup(name="Zona II")
+                fg_z1 = folium.FeatureGroup(name="Zona I")
+
+                for _, row in Aceleracion_table.dropna(subset=['LATITUD', 'LONGITUD']).iterrows():
+                    acc = row['ACELERACION']
+                    zona_calc = obtener_zona_sismica(acc)
+                    color = {'Z4': '#d32f2f', 'Z3': '#f57c00', 'Z2': '#fbc02d', 'Z1': '#388e3c'}[zona_calc]
+                    dest = {'Z4': fg_z4, 'Z3': fg_z3, 'Z2': fg_z2, 'Z1': fg_z1}[zona_calc]
+
+                    folium.CircleMarker(
+                        location=[row['LATITUD'], row['LONGITUD']],
+                        radius=5, color=color, fill=True, fill_color=color, fill_opacity=0.7,
+                        popup=f"<b>{row['DEPARTAMENTO']}</b><br>a0: {acc}g<br>{zona_calc}",
+                        tooltip=f"{row['DEPARTAMENTO']}"
+                    ).add_to(dest)
+
+                fg_z4.add_to(m); fg_z3.add_to(m); fg_z2.add_to(m); fg_z1.add_to(m)
+                folium.LayerControl().add_to(m)
+                # Solo se devuelven los clics sobre marcadores: paneo y zoom no
+                # viajan al servidor ni provocan una nueva ejecución del script
+                output = st_folium(
+                    m, height=400, use_container_width=True,
+                    returned_objects=["last_object_clicked"]
+                )
+
+            clic = output.get('last_object_clicked') if output else None
+            if clic and clic != st.session_state.get('ultimo_clic_mapa'):
+                st.session_state['ultimo_clic_mapa'] = clic
+                lat_click, lon_click = clic['lat'], clic['lng']
+
+                dist = (Aceleracion_table['LATITUD'] - lat_click)**2 + (Aceleracion_table['LONGITUD'] - lon_click)**2
+                nombre_nuevo = Aceleracion_table.loc[dist.idxmin(), 'DEPARTAMENTO']
+                
+                if nombre_nuevo != st.session_state['departamento_actual']:
+                    st.session_state['departamento_actual'] = nombre_nuevo
+                    st.rerun()
+
+            with col_info:
+                accel_val = Aceleracion_table.loc[Aceleracion_table['DEPARTAMENTO'] == st.session_state['departamento_actual'], 'ACELERACION'].values[0]
+                
+                st.markdown("#### Sitio Seleccionado")
+                st.success(f"📍 {st.session_state['departamento_actual']}")
+                st.metric("Aceleración a₀", f"{accel_val:.4f} g")
+                st.info(f"Zona: {obtener_zona_sismica(accel_val)}")
+                st.caption("Seleccione otro sitio haciendo clic en el mapa.")
+
+    # --- 5. SIDEBAR - PARÁMETROS DE ENTRADA ---
+    st.sidebar.header("Parámetros de Diseño (Sismo)")
+
+    # 1. Ubicación y Suelo
+    Departamento = st.session_state['departamento_actual']
+    st.sidebar.subheader("1. Ubicación y Suelo")
+    st.sidebar.info(f"**Sitio:** {Departamento}")
+
+    try:
+        a_0 = Aceleracion_table.loc[Aceleracion_table['DEPARTAMENTO'] == Departamento, 'ACELERACION'].values[0]
+    except IndexError:
+        st.error("Error: Departamento no encontrado en Excel.")
+        st.stop()
+
+    Zona_Sismica = obtener_zona_sismica(a_0)
+
+    metodo_suelo = st.sidebar.radio(
+        "¿Cómo desea definir el suelo?",
+        ["Ingresar/Calcular Vs30", "Seleccionar Tipo (A-E)"]
+    )
+
+    Vs30 = None
+    if metodo_suelo == "Ingresar/Calcular Vs30":
+        if Departamento == 'MANAGUA':
+            sitios_managua = Vs30_table['NOMBRE DEL SITIO'].unique()
+            Ubicacion_E = st.sidebar.selectbox("Sitio Específico (Managua)", sitios_managua)
+            col_vs30 = 'Vs30(m/s)' if 'Vs30(m/s)' in Vs30_table.columns else 'Vs30 (m/s)'
+            Vs30 = Vs30_table.loc[Vs30_table['NOMBRE DEL SITIO'] == Ubicacion_E, col_vs30].values[0]
+            st.sidebar.write(f"*Vs30 base de datos: {Vs30} m/s*")
+        else:
+            Vs30 = st.sidebar.number_input("Ingrese Vs30 (m/s)", min_value=100.0, max_value=2500.0, value=360.0)
+        Tipo_Suelo = clasificar_suelo(Vs30)
+    else:
+        
+        opciones_visuales = [
+            "A (Roca Rígida)", 
+            "B (Roca)", 
+            "C (Suelo Muy Denso / Roca Blanda)", 
+            "D (Suelo Rígido)", 
+            "E (Suelo Blando)"
+        ]
+        seleccion = st.sidebar.selectbox("Seleccione el Tipo de Suelo:", opciones_visuales, index=3)
+        Tipo_Suelo = seleccion.split(" ")[0] 
+        
+        st.sidebar.caption("Selección segun la tabla 6.3.1.")
+
+    if Vs30:
+        st.sidebar.info(f"**Suelo Tipo {Tipo_Suelo}** (Zona {Zona_Sismica}) | Vs30: {Vs30} m/s")
+    else:
+        st.sidebar.info(f"**Suelo Tipo {Tipo_Suelo}** (Zona {Zona_Sismica})")
+
+    # 2. Importancia
+    st.sidebar.subheader("2. Grupo de Importancia")
+    grupo_dict = GRUPO_DICT
+    Grupo_I_key = st.sidebar.selectbox("Seleccione Grupo", list(grupo_dict.keys()), index=2)
+    I = grupo_dict[Grupo_I_key]
+
+    # --- CALCULO DE CDS ---
+    CDS_calculado = obtener_cds(a_0, Grupo_I_key)
+    st.sidebar.success(f"**Categoría Diseño Sísmico: CDS {CDS_calculado}**")
+    
+    # 3. Sistema Estructural
+    st.sidebar.subheader("3. Sistema Estructural")
+    cat_sistemas = {
+        "Muros de Carga": "MurosDeCarga",
+        "Muros Estruct. / Arriostrados": "MurosEstructurales",
+        "Marcos a Momento": "MarcosAMomento",
+        "Duales (Especiales)": "DualesEspeciales",
+        "Duales (Intermedios)": "DualesIntermedios",
+        "Voladizo / Otros": "ColumnasEnVoladizo"
+    }
+    cat_sel = st.sidebar.selectbox("Categoría", list(cat_sistemas.keys()))
+    df_sys = data[cat_sistemas[cat_sel]]
+    Sistema = st.sidebar.selectbox("Sistema Específico", df_sys['Sistema Estructural'].unique())
+
+    row_sys = df_sys[df_sys['Sistema Estructural'] == Sistema].iloc[0]
+    R = row_sys['R']
+    Omega = row_sys['Omega']
+    Cd = row_sys['Coeficiente de deflexion, Cd']
+
+    # =========================================================================
+    #  IRREGULARIDADES 
+    # =========================================================================
+    st.sidebar.subheader("4. Factores de Irregularidad")
+    
+    # --- A. IRREGULARIDAD EN PLANTA (Φp = Φpa x Φpb) ---
+    with st.sidebar.expander("Irregularidad en Planta (Φp)"):
+        st.markdown("*(Cálculo según Tabla 5.4.1)*")
+        
+        # GRUPO Φpa
+        st.markdown("**Grupo A (Φpa):** Torsión, Esquinas, Diafragma")
+        
+        # Tipo 1: Torsional
+        torsion_opt = st.selectbox("Tipo 1: Torsional", ["Regular (1.0)", "Irregular (0.9)", "Extrema (0.8)"])
+        phi_1 = 1.0
+        if "Irregular (0.9)" in torsion_opt: phi_1 = 0.9
+        elif "Extrema (0.8)" in torsion_opt: phi_1 = 0.8
+        
+        # Tipo 2: Esquinas
+        chk_p2 = st.checkbox("Tipo 2: Esquinas Entrantes (0.9)")
+        phi_2 = 0.9 if chk_p2 else 1.0
+        
+        # Tipo 3: Diafragma
+        chk_p3 = st.checkbox("Tipo 3: Discontinuidad Diafragma (0.9)")
+        phi_3 = 0.9 if chk_p3 else 1.0
+        
+        # Cálculo Φpa
+        Phi_PA = min(phi_1, phi_2, phi_3)
+        
+        # GRUPO Φpb
+        st.markdown("**Grupo B (Φpb):** Ejes no paralelos")
+        chk_p4 = st.checkbox("Tipo 4: Ejes No Paralelos (0.8)")
+        Phi_PB = 0.8 if chk_p4 else 1.0
+        
+        # Cálculo Final Φp
+        Phi_P = Phi_PA * Phi_PB
+        st.info(f"Φp = {Phi_PA} (Grp A) × {Phi_PB} (Grp B) = **{Phi_P:.2f}**")
+
+    # --- B. IRREGULARIDAD EN ELEVACIÓN (Φe = Φea x Φeb) ---
+    with st.sidebar.expander("Irregularidad en Elevación (Φe)"):
+        st.markdown("*(Cálculo según Tabla 5.4.1)*")
+
+        # --- GRUPO A (Φea): Piso Flexible y Débil ---
+        st.markdown("**Grupo A (Φea):** Piso Flexible y Piso Débil")
+        
+        # Tipo 1: Piso Flexible
+        blando_opt = st.selectbox("Tipo 1: Piso Flexible", ["Regular", "Irregular (0.8)", "Extrema (3Ex)"])
+        phi_1_elev = 1.0 if blando_opt == "Regular" else 0.8
+
+        if "Extrema" in blando_opt and CDS_calculado in ["C", "D"]:
+            st.error(f"⚠️ Irregularidad 3Ex PROHIBIDA en CDS {CDS_calculado} (Sec 5.4.3).")
+
+        # Tipo 4: Piso Débil
+        debil_opt = st.selectbox("Tipo 4: Piso Débil", ["Regular", "Irregular (0.8)", "Extrema (4Ex)"])
+        phi_4_elev = 1.0 if debil_opt == "Regular" else 0.8
+
+        if "Extrema" in debil_opt and CDS_calculado in ["C", "D"]:
+            st.error(f"⚠️ Irregularidad 4Ex PROHIBIDA en CDS {CDS_calculado} (Sec 5.4.3).")
+
+        # Calculamos el Φea
+        Phi_EA = min(phi_1_elev, phi_4_elev)
+
+        # --- GRUPO B (Φeb): Masa y Geometría ---
+        st.markdown("**Grupo B (Φeb):** Masa y Geometría")
+        chk_e2 = st.checkbox("Tipo 2: Peso/Masa (0.9)")
+        phi_2_elev = 0.9 if chk_e2 else 1.0
+        chk_e3 = st.checkbox("Tipo 3: Geométrica Vertical (0.9)")
+        phi_3_elev = 0.9 if chk_e3 else 1.0
+
+        # Calculamos el Φeb
+        Phi_EB = min(phi_2_elev, phi_3_elev)
+
+        # Cálculo Final Φe
+        Phi_E = Phi_EA * Phi_EB
+        st.info(f"Φe = {Phi_EA} (Grp A) × {Phi_EB} (Grp B) = **{Phi_E:.2f}**")
+    
+    # Cálculo de ro 
+    R_o = R * Phi_P * Phi_E
+
+    # --- Documentos ---
+    st.sidebar.markdown("---")
+    st.sidebar.markdown("### 📚 Documentación Oficial")
+    
+    # NSM-22
+    with open("NormaManaguaJunio22.pdf", "rb") as f:
+        pdf_data = f.read()
+    
+    st.sidebar.download_button(
+        label="📘 Descargar Norma NSM-22 (PDF)",
+        data=pdf_data,
+        file_name="Norma_Sismorresistente_Managua_2021.pdf",
+        mime="application/pdf"
+    )
+
+    with open("Manual de Usuario NICSPECTRA.pdf", "rb") as f:
+            pdf_manual = f.read()
+    st.sidebar.download_button(
+            label="📕 Descargar Manual de Usuario",
+            data=pdf_manual,
+            file_name="Manual_Usuario_NICSPECTRA.pdf",
+            mime="application/pdf"
+        )
+
+
+    # --- 5. MOTOR DE CÁLCULO ---
+    st.header("Resultados del Análisis (NSM-22)")
+
+    # Cálculo Ceniza
+    C_cv, es_zona_riesgo = calcular_carga_ceniza(Departamento)
+    st.session_state['carga_ceniza'] = C_cv
+
+    # Cálculos Sísmicos
+    F_as = obtener_Fas(Zona_Sismica, Tipo_Suelo)
+    FS_Tb, FS_Tc = obtener_factores_ajuste_espectral(Tipo_Suelo)
+    A_o = a_0 * F_as * I
+    
+    # Cálculo Final 
+
+    Tb_base, Tc_base, Td_base = TB_BASE, TC_BASE, TD_BASE
+    beta, p, q = BETA, P_EXP, Q_EXP
+    T_b = FS_Tb * Tb_base
+    T_c = FS_Tc * Tc_base
+    T_d = Td_base
+
+    # --- VISUALIZACIÓN ---
+    with st.container(border=True):
+        st.subheader("Cargas Ambientales (Sección 7.3 & RNC-07)")
+        col_ash1, col_ash2 = st.columns([1, 3])
+        
+        col_ash1.metric("Carga Ceniza (Ccv)", f"{C_cv} kg/m²")
+        
+        if es_zona_riesgo:
+            col_ash2.warning(f"⚠️ **Zona de Riesgo Volcánico:** {Departamento}")
+            col_ash2.markdown(f"La ubicación coincide con un Departamento o Municipio de riesgo (RNC-07 Art. 14 / NSM-22 Sec 7.3). Se aplica carga mínima de **20 kg/m²**.")
+        else:
+            col_ash2.success(f"✅ **Zona de Bajo Riesgo:** {Departamento}")
+            col_ash2.caption("No se requiere carga de ceniza.")
+
+    st.subheader("Parámetros Sísmicos de Diseño")
+    c1, c2, c3, c4 = st.columns(4)
+    c1.metric("Aceleracion (a₀)", f"{a_0:.3f} g")
+    c2.metric("Factor Suelo (Fas)", f"{F_as:.2f}")
+    c3.metric("Importancia (I)", f"{I:.2f}")
+    c4.metric("Acel. Diseño (A₀)", f"{A_o:.4f} g", help="a₀ × Fas × I")
+
+    st.markdown("---")
+    st.subheader("Factores de Irregularidad y Respuesta Sísmica")
+
+    # Fila 1: Resultados de las Irregularidades
+    col_irr1, col_irr2, col_irr_vacia = st.columns([1, 1, 2]) 
+    col_irr1.metric("Irreg. en Planta (Φp)", f"{Phi_P:.2f}")
+    col_irr2.metric("Irreg. en Elevación (Φe)", f"{Phi_E:.2f}")
+
+    # Fila 2: Coeficientes del Sistema
+    k1, k2, k3, k4 = st.columns(4)
+    k1.metric("Coef. R (Sistema)", f"{R:.2f}")
+    k2.metric("R₀ (Reducido)", f"{R_o:.2f}", delta_color="inverse", help="R × Φp × Φe (Valor final para diseño)")
+    k3.metric("Ω₀ (Sobrerresistencia)", f"{Omega:.2f}")
+    k4.metric("Cd (Deflexión)", f"{Cd:.2f}")
+
+    # --- 6. GRÁFICOS  ---
+    def obtener_imagen(figure):
+        import io
+        buf = io.BytesIO()
+        figure.savefig(buf, format='png', dpi=300, bbox_inches='tight')
+        buf.seek(0)
+        return buf
+
+    # Los espectros y su gráfico se buscan primero en el almacén persistente
+    entradas_espectro = {
+        "modulo": "sismo", "departamento": Departamento, "suelo": Tipo_Suelo,
+        "A_o": A_o, "R_o": R_o, "T_b": T_b, "T_c": T_c, "T_d": T_d,
+        "beta": beta, "p": p, "q": q
+    }
+    clave_espectro = almacen.clave_resultado(entradas_espectro)
+    espectro = almacen.obtener_arrays(clave_espectro, "espectro")
+    img_png = almacen.obtener(clave_espectro, "png")
+
+    if espectro is not None and img_png is not None:
+        T_vals, A_diseno = espectro["T_vals"], espectro["A_diseno"]
+    else:
+        T_vals = np.linspace(0.0, 4.0, 401)
+        A_elastico, A_diseno = espectro_nsm22(T_vals, A_o, T_b, T_c, T_d, R_o, beta, p, q)
+
+        # ------------------------------------------------------------------------
+        # 6. GRÁFICOS Y DESCARGAS 
+        # ------------------------------------------------------------------------
+        fig, ax = plt.subplots(figsize=(10, 5))
+        ax.plot(T_vals, A_elastico, 'k-', linewidth=2, label='Elástico (A)')
+        ax.plot(T_vals, A_diseno, 'r-', linewidth=2, label=f'Diseño (Ad) [Ro={R_o:.2f}]')
+        
+        ax.set_title(f"Espectros NSM-22 | {Departamento} | Suelo Tipo {Tipo_Suelo}", fontsize=14)
+        ax.set_xlabel("Periodo (s)"); ax.set_ylabel("Aceleración (g)")
+        
+        # -------------------------------
+        # Ticks del Eje Y cada 0.1 g + Minor Ticks
+        # -------------------------------
+        
+        max_val = max(max(A_elastico), max(A_diseno))
+        limite_y = np.ceil(max_val * 10) / 10 
+        if limite_y < max_val: 
+            limite_y += 0.1
+        
+        ax.set_yticks(np.arange(0, limite_y + 0.15, 0.1))
+        ax.set_ylim(0, limite_y + 0.05)
+        
+        # --- MINOR TICKS ---
+        ax.minorticks_on()
+        ax.grid(which='major', linestyle='--', linewidth=0.7, alpha=0.8, color='black')
+        ax.grid(which='minor', linestyle=':', linewidth=0.5, alpha=0.5, color='gray')
+        
+        ax.legend(); ax.set_xlim(0, 4)
+
+        img_png = obtener_imagen(fig).getvalue()
+        plt.close(fig)
+        almacen.guardar_arrays(clave_espectro, "espectro", T_vals=T_vals, A_elastico=A_elastico, A_diseno=A_diseno)
+        almacen.guardar(clave_espectro, "png", img_png)
+
+    st.image(img_png, use_container_width=True)
+
+    # --- 7. CONSULTA DE ORDENADAS Sa(T) ---
+    with st.expander("Consulta de Sa(T) y Esquinas del Espectro"):
+        e1, e2, e3, e4 = st.columns(4)
+        e1.metric("T_b", f"{T_b:.3f} s")
+        e2.metric("T_c", f"{T_c:.3f} s")
+        e3.metric("T_d", f"{T_d:.3f} s")
+        e4.metric("Meseta (A₀·β/R₀)", f"{(A_o * beta / R_o if R_o > 0 else A_o * beta):.4f} g")
+
+        periodos_input = st.text_input("Periodos fundamentales (s)", value="0.3, 0.6, 1.2")
+        try:
+            periodos = np.array([float(x.strip()) for x in periodos_input.split(',') if x.strip()])
+        except ValueError:
+            st.warning("⚠️ Ingrese los periodos separados por comas.")
+        else:
+            _, sa_periodos = espectro_nsm22(periodos, A_o, T_b, T_c, T_d, R_o, beta, p, q)
+            tabla_sa = pd.DataFrame({'Periodo(s)': periodos, 'Sa_Diseño(g)': np.round(sa_periodos, 4)})
+            # Misma consulta por la tabla de esquinas (R0 redondeado hacia abajo)
+            try:
+                fila = indice_escenario(Zona_Sismica, Tipo_Suelo, I, R_o)
+                tabla_sa['Sa_Tabla(g)'] = np.round(consultar_sa(fila, periodos, a_0), 4)
+                st.caption(f"Sa_Tabla usa la fila de R0 = {tabla_esquinas()['R0'].iloc[fila[0]]:.2f} de la tabla de esquinas.")
+            except ValueError as e:
+                st.caption(f"Tabla de esquinas no aplicable: {e}")
+            st.dataframe(tabla_sa, use_container_width=True, hide_index=True)
+
+        st.download_button(
+            "📥 Descargar Tabla de Esquinas (.csv)",
+            tabla_esquinas().to_csv(index=False).encode('utf-8'),
+            "NSM22_tabla_esquinas.csv", "text/csv"
+        )
+
+    nombre_dep = Departamento.replace(" ", "_")
+    
+    # Nombre base: 
+    nombre_base = f"NSM22_{nombre_dep}_Suelo{Tipo_Suelo}"
+
+    st.markdown("---")
+    st.subheader("Descargas")
+
+    @st.cache_data
+    def convertir_txt(t, sa):
+        df = pd.DataFrame({'Periodo(s)': t, 'Sa_Diseño(g)': sa})
+        return df.to_string(index=False).encode('utf-8')
+
+    # --- MENÚ DE DESCARGA ---
+    
+    opcion_descarga = st.selectbox(
+        "Seleccione el formato a descargar:",
+        ["Texto Plano (.txt)", "Gráfico de Espectro (.png)", "Reporte PDF (.pdf)"]
+    )
+
+    if opcion_descarga == "Texto Plano (.txt)":
+        txt_data = convertir_txt(T_vals, A_diseno)
+        st.download_button(
+            label=f"📄 Descargar TXT ({nombre_base})", 
+            data=txt_data, 
+            file_name=f"{nombre_base}.txt", 
+            mime="text/plain",
+            key="dl_txt"
+        )
+        
+    elif opcion_descarga == "Gráfico de Espectro (.png)":
+        st.download_button(
+            label=f"🖼️ Descargar PNG ({nombre_base})",
+            data=img_png,
+            file_name=f"{nombre_base}.png",
+            mime="image/png",
+            key="dl_png"
+        )
+
+    elif opcion_descarga == "Reporte PDF (.pdf)":
+        
+        datos_pdf = {
+            "departamento": Departamento,
+            "a0": a_0,
+            "suelo": Tipo_Suelo,
+            "vs30": Vs30 if Vs30 else "N/A",
+            "grupo": Grupo_I_key,
+            "I": I,
+            "cds": CDS_calculado,
+            "sistema": Sistema,
+            "Fas": F_as,
+            "A0": A_o,
+            "R": R,
+            "Phi_P": Phi_P,
+            "Phi_E": Phi_E,
+            "Ro": R_o,
+            "Omega": Omega,
+            "Cd": Cd,
+            "Ccv": C_cv 
+        }
+        
+        # La fecha va en el pie de página, por eso forma parte de la clave
+        clave_pdf = almacen.clave_resultado({
+            "datos": datos_pdf, "espectro": clave_espectro, "fecha": datetime.now().strftime("%d/%m/%Y")
+        })
+        pdf_bytes = almacen.obtener(clave_pdf, "pdf")
+        if pdf_bytes is None:
+            import reporte
+            pdf_bytes = reporte.generar_pdf_sismo(datos_pdf, img_png)
+            almacen.guardar(clave_pdf, "pdf", pdf_bytes)
+        
+        st.download_button(
+            label="📄 Descargar Reporte PDF",
+            data=pdf_bytes,
+            file_name=f"Reporte_{nombre_base}.pdf",
+            mime="application/pdf"
+        )
@@ -0,0 +1,565 @@
+"""
+Módulo de Viento (RNC-07) de NICSPECTRA.
+
+Al abrir la página solo se cargan streamlit y pandas; matplotlib y fpdf se
+importan únicamente al generar el mapa de fachada o el reporte PDF.
+"""
+import streamlit as st
+import numpy as np
+import pandas as pd
+import io
+import os
+import hashlib
+import re
+import tempfile
+import zipfile
+from datetime import datetime
+
+# --- Almacén persistente de resultados ---
+import almacen
+# --- Tablas y fórmulas RNC-07 compartidas ---
+from rnc07 import TABLA_VR, TABLA_RUG, TABLA_FTR, K_PRESION, CP_BARLO, CP_SOTA, factor_altura
+
+# ============================================================================
+# MÓDULO DE VIENTO (RNC-07)
+# ============================================================================
+def parametros_viento(zona_opt, grupo_opt, rugosidad_opt, topo_opt):
+    """Parámetros RNC-07 del sitio. Devuelve (Vr, alpha, delta, Ftr) o None."""
+    zona_key = zona_opt.split(" (")[0] 
+    mapa_zona = {"Zona 1": 1, "Zona 2": 2, "Zona 3": 3}
+    if zona_key not in mapa_zona: return None
+        
+    zona_idx = mapa_zona[zona_key]
+    es_grupo_a = "Grupo A" in grupo_opt
+    Vr = TABLA_VR[zona_idx]['A' if es_grupo_a else 'B']
+
+    rug_cod = rugosidad_opt.split(" ")[0]
+    alpha, delta = TABLA_RUG[rug_cod]['a'], TABLA_RUG[rug_cod]['d']
+
+    topo_cod = topo_opt.split(" ")[0]
+    if rug_cod == 'R1': Ftr = 1.0
+    else: Ftr = TABLA_FTR[topo_cod][rug_cod]
+
+    return Vr, alpha, delta, Ftr
+
+def calcular_viento(B, L, h_pisos, zona_opt, grupo_opt, rugosidad_opt, topo_opt):
+    """Fuerzas de viento por piso según RNC-07. Devuelve (Vr, sum_fx, sum_fy, resultados)."""
+    z_acum = []
+    acc = 0
+    for h in h_pisos:
+        acc += h
+        z_acum.append(acc)
+    H_total = z_acum[-1]
+
+    # Lógica RNC-07
+    parametros = parametros_viento(zona_opt, grupo_opt, rugosidad_opt, topo_opt)
+    if parametros is None: return None
+    Vr, alpha, delta, Ftr = parametros
+
+    Vd_sot = Vr * float(factor_altura(H_total, alpha, delta)) * Ftr
+    q_sot = K_PRESION * CP_SOTA * (Vd_sot**2)
+
+    resultados = []
+    sum_fx, sum_fy = 0, 0
+
+    for i, z in enumerate(z_acum):
+        h_piso = h_pisos[i]
+        h_trib = h_piso / 2.0 if i == len(h_pisos) - 1 else (h_piso / 2.0) + (h_pisos[i+1] / 2.0)
+        
+        Fa = float(factor_altura(z, alpha, delta))
+        Vd = Vr * Fa * Ftr
+        q_barlo = K_PRESION * CP_BARLO * (Vd**2)
+        q_neto = q_barlo + q_sot
+        
+        fx = q_neto * B * h_trib / 1000
+        fy = q_neto * L * h_trib / 1000
+        sum_fx += fx; sum_fy += fy
+
+        resultados.append({"Nivel": f"Piso {i+1}", "Z (m)": f"{z:.2f}", "Fa": f"{Fa:.3f}", "Vd (m/s)": f"{Vd:.2f}", 
+                           "q_neto (kg/m²)": f"{q_neto:.2f}", "Fx (Ton)": round(fx, 3), "Fy (Ton)": round(fy, 3)})
+
+    return Vr, sum_fx, sum_fy, resultados
+
+# ============================================================================
+# CÁLCULO EN LOTE (UN EDIFICIO POR FILA DE ARCHIVO)
+# ============================================================================
+COLUMNAS_LOTE = ["Edificio", "B", "L", "Alturas", "Zona", "Grupo", "Rugosidad", "Topografia"]
+TAMANO_BLOQUE = 500
+# Filas de datos por hoja de Excel (1,048,576 menos el encabezado)
+FILAS_POR_HOJA = 1_048_575
+
+def leer_lote(df):
+    """
+    Interpreta la tabla subida (una fila por edificio) con operaciones por columna.
+    Devuelve (lote, alturas, invalidos): lote con B, L, Vr, alpha, delta y Ftr por
+    edificio, alturas como arreglo (edificios, pisos) relleno con NaN, y la lista
+    de edificios descartados por datos incompletos.
+    """
+    df = df.rename(columns=lambda c: str(c).strip())
+    faltantes = [c for c in COLUMNAS_LOTE if c not in df.columns]
+    if faltantes:
+        raise ValueError(f"Faltan columnas en el archivo: {', '.join(faltantes)}")
+
+    lote = pd.DataFrame({"Edificio": df["Edificio"].astype(str).str.strip()})
+    lote["B"] = pd.to_numeric(df["B"], errors="coerce")
+    lote["L"] = pd.to_numeric(df["L"], errors="coerce")
+
+    # Se aceptan tanto los códigos (2, A, R3, T3) como las etiquetas del formulario
+    zona = df["Zona"].astype(str).str.extract(r"([123])")[0]
+    grupo = df["Grupo"].astype(str).str.upper().str.extract(r"\b([AB])\b")[0]
+    rug = df["Rugosidad"].astype(str).str.upper().str.extract(r"(R[1-4])")[0]
+    topo = df["Topografia"].astype(str).str.upper().str.extract(r"(T[1-5])")[0]
+
+    lote["Vr"] = (zona + grupo).map({f"{z}{g}": v for z, fila in TABLA_VR.items() for g, v in fila.items()})
+    lote["alpha"] = rug.map({r: v['a'] for r, v in TABLA_RUG.items()})
+    lote["delta"] = rug.map({r: v['d'] for r, v in TABLA_RUG.items()})
+    lote["Ftr"] = (topo + rug).map({t + r: v for t, fila in TABLA_FTR.items() for r, v in fila.items()})
+    lote.loc[rug == "R1", "Ftr"] = 1.0
+    lote["Zona"], lote["Grupo"], lote["Rugosidad"], lote["Topografia"] = "Zona " + zona, "Grupo " + grupo, rug, topo
+
+    alturas = (
+        df["Alturas"].astype(str).str.replace(";", ",").str.split(",", expand=True)
+        .apply(lambda col: pd.to_numeric(col.str.strip(), errors="coerce"))
+        .to_numpy(dtype=float)
+    )
+    presentes = ~np.isnan(alturas)
+    n_pisos = presentes.sum(axis=1)
+    # Las alturas deben ser positivas y sin huecos (p. ej. "4.0,,3.5")
+    contiguas = np.all(presentes == (np.arange(alturas.shape[1]) < n_pisos[:, None]), axis=1)
+    positivas = np.all(np.isnan(alturas) | (alturas > 0), axis=1)
+
+    validos = (
+        lote[["B", "L", "Vr", "alpha", "delta", "Ftr"]].notna().all(axis=1).to_numpy()
+        & (lote["B"] > 0).to_numpy() & (lote["L"] > 0).to_numpy()
+        & (n_pisos > 0) & contiguas & positivas
+    )
+    alturas = alturas[validos][:, :max(int(n_pisos[validos].max(initial=0)), 1)]
+    return lote[validos].reset_index(drop=True), alturas, lote.loc[~validos, "Edificio"].tolist()
+
+def calcular_viento_lote(B, L, alturas, Vr, alpha, delta, Ftr):
+    """
+    Versión vectorizada de calcular_viento para varios edificios.
+    Los parámetros son arreglos (edificios,) y alturas es (edificios, pisos)
+    con NaN después del último piso. Devuelve un diccionario de arreglos
+    (edificios, pisos) con Z, Fa, Vd, q_neto, Fx y Fy (NaN fuera del edificio).
+    """
+    B, L, Vr, alpha, delta, Ftr = (np.asarray(v, dtype=float)[:, None] for v in (B, L, Vr, alpha, delta, Ftr))
+    presentes = ~np.isnan(alturas)
+    h = np.where(presentes, alturas, 0.0)
+    z = np.cumsum(h, axis=1)
+    H_total = z[:, -1:]
+
+    # Altura tributaria: mitad del piso propio más mitad del piso superior
+    h_sig = np.concatenate([h[:, 1:], np.zeros((h.shape[0], 1))], axis=1)
+    h_trib = h / 2.0 + h_sig / 2.0
+
+    q_sot = K_PRESION * CP_SOTA * (Vr * factor_altura(H_total, alpha, delta) * Ftr) ** 2
+
+    Fa = factor_altura(z, alpha, delta)
+    Vd = Vr * Fa * Ftr
+    q_neto = K_PRESION * CP_BARLO * Vd ** 2 + q_sot
+
+    resultado = {
+        "Z": z, "Fa": Fa, "Vd": Vd, "q_neto": q_neto,
+        "Fx": q_neto * B * h_trib / 1000, "Fy": q_neto * L * h_trib / 1000
+    }
+    return {k: np.where(presentes, v, np.nan) for k, v in resultado.items()}
+
+def tablas_lote(lote, calculo):
+    """Convierte un bloque calculado en (resumen por edificio, tabla larga por piso)."""
+    presentes = ~np.isnan(calculo["Z"])
+    resumen = pd.DataFrame({
+        "Edificio": lote["Edificio"],
+        "Pisos": presentes.sum(axis=1),
+        "H (m)": np.nanmax(calculo["Z"], axis=1).round(2),
+        "Vr (m/s)": lote["Vr"],
+        "Cortante FX (Ton)": np.nansum(calculo["Fx"], axis=1).round(3),
+        "Cortante FY (Ton)": np.nansum(calculo["Fy"], axis=1).round(3),
+    })
+    fila, piso = np.nonzero(presentes)
+    pisos = pd.DataFrame({
+        "Edificio": lote["Edificio"].to_numpy()[fila],
+        "Nivel": [f"Piso {i}" for i in piso + 1],
+        "Z (m)": calculo["Z"][presentes].round(2),
+        "Fa": calculo["Fa"][presentes].round(3),
+        "Vd (m/s)": calculo["Vd"][presentes].round(2),
+        "q_neto (kg/m²)": calculo["q_neto"][presentes].round(2),
+        "Fx (Ton)": calculo["Fx"][presentes].round(3),
+        "Fy (Ton)": calculo["Fy"][presentes].round(3),
+    })
+    return resumen, pisos
+
+def trabajos_reportes_lote(lote, resumen, pisos, carpeta):
+    """Genera (datos, resultados, destino) por edificio para reporte.generar_reportes_viento."""
+    fin = np.cumsum(resumen["Pisos"].to_numpy())
+    inicio = fin - resumen["Pisos"].to_numpy()
+    formatos = {"Z (m)": "{:.2f}", "Fa": "{:.3f}", "Vd (m/s)": "{:.2f}", "q_neto (kg/m²)": "{:.2f}"}
+    for i in range(len(resumen)):
+        fila, res = lote.iloc[i], resumen.iloc[i]
+        tabla = pisos.iloc[inicio[i]:fin[i]].drop(columns="Edificio")
+        for col, fmt in formatos.items():
+            tabla[col] = tabla[col].map(fmt.format)
+        datos = {
+            "nombre": fila["Edificio"], "B": fila["B"], "L": fila["L"], "H": res["H (m)"],
+            "zona": fila["Zona"], "grupo": fila["Grupo"], "rugosidad": fila["Rugosidad"], "topografia": fila["Topografia"],
+            "Vr": fila["Vr"], "sum_fx": res["Cortante FX (Ton)"], "sum_fy": res["Cortante FY (Ton)"]
+        }
+        nombre_archivo = re.sub(r"[^\w\-]+", "_", fila["Edificio"]).strip("_") or "Edificio"
+        yield datos, tabla.to_dict("records"), os.path.join(carpeta, f"{i + 1:04d}_{nombre_archivo}.pdf")
+
+def calcular_archivo_lote(archivo):
+    """
+    Lee y calcula un archivo de lote completo. Devuelve un diccionario con
+    lote, resumen, pisos, invalidos y el libro XLSX (bytes), o None si el
+    archivo no se pudo leer.
+    """
+    try:
+        df_entrada = pd.read_csv(archivo) if archivo.name.lower().endswith(".csv") else pd.read_excel(archivo)
+        lote, alturas, invalidos = leer_lote(df_entrada)
+    except Exception as e:
+        st.error(f"Error al leer el archivo: {e}")
+        return None
+
+    # Cálculo por bloques con avance visible
+    n = len(lote)
+    barra = st.progress(0.0, text=f"Calculando 0 de {n} edificios...")
+    resumenes, tablas_pisos = [], []
+    for inicio in range(0, n, TAMANO_BLOQUE):
+        fin = min(inicio + TAMANO_BLOQUE, n)
+        bloque = lote.iloc[inicio:fin].reset_index(drop=True)
+        calculo = calcular_viento_lote(
+            bloque["B"], bloque["L"], alturas[inicio:fin],
+            bloque["Vr"], bloque["alpha"], bloque["delta"], bloque["Ftr"]
+        )
+        resumen, pisos = tablas_lote(bloque, calculo)
+        resumenes.append(resumen); tablas_pisos.append(pisos)
+        barra.progress(fin / n, text=f"Calculando {fin} de {n} edificios...")
+    barra.empty()
+
+    resumen = pd.concat(resumenes, ignore_index=True) if resumenes else pd.DataFrame()
+    pisos = pd.concat(tablas_pisos, ignore_index=True) if tablas_pisos else pd.DataFrame()
+
+    # La tabla por piso puede superar el límite de filas de Excel: se reparte en varias hojas
+    xlsx = None
+    if n:
+        try:
+            buf = io.BytesIO()
+            with pd.ExcelWriter(buf, engine="openpyxl") as writer:
+                escribir_hoja(writer, resumen, "Resumen")
+                escribir_hoja(writer, pisos, "Pisos")
+            xlsx = buf.getvalue()
+        except Exception as e:
+            st.error(f"Error al generar el libro de resultados: {e}")
+    return {"lote": lote, "resumen": resumen, "pisos": pisos, "invalidos": invalidos, "xlsx": xlsx}
+
+def escribir_hoja(writer, df, nombre):
+    """Escribe df en una o varias hojas (nombre, nombre_2, ...) de hasta FILAS_POR_HOJA filas."""
+    for parte, inicio in enumerate(range(0, max(len(df), 1), FILAS_POR_HOJA)):
+        hoja = nombre if parte == 0 else f"{nombre}_{parte + 1}"
+        df.iloc[inicio:inicio + FILAS_POR_HOJA].to_excel(writer, sheet_name=hoja, index=False)
+
+def app_viento_lote():
+    st.subheader("Cálculo en Lote")
+    st.markdown(
+        "Suba un archivo **XLSX/CSV** con una fila por edificio y las columnas "
+        f"`{'`, `'.join(COLUMNAS_LOTE)}`. Las alturas de entrepiso se separan con comas."
+    )
+    plantilla = pd.DataFrame([
+        {"Edificio": "Edificio 1", "B": 20.0, "L": 15.0, "Alturas": "4.0, 3.5, 3.5, 3.5",
+         "Zona": 2, "Grupo": "B", "Rugosidad": "R3", "Topografia": "T3"}
+    ])
+    st.download_button("📄 Descargar Plantilla CSV", plantilla.to_csv(index=False).encode('utf-8'),
+                       "plantilla_lote_viento.csv", "text/csv")
+
+    archivo = st.file_uploader("Archivo de edificios", type=["xlsx", "csv"])
+    if archivo is None:
+        return
+
+    # El resultado se guarda en la sesión con el hash del archivo: al presionar
+    # botones o descargar, Streamlit vuelve a ejecutar el script sin recalcular
+    huella = hashlib.sha256(archivo.getvalue()).hexdigest()
+    calculado = st.session_state.get('lote_viento')
+    if calculado is None or calculado["huella"] != huella:
+        calculado = calcular_archivo_lote(archivo)
+        if calculado is None:
+            return
+        calculado["huella"] = huella
+        st.session_state['lote_viento'] = calculado
+
+    lote, resumen, pisos, invalidos = calculado["lote"], calculado["resumen"], calculado["pisos"], calculado["invalidos"]
+    n = len(lote)
+    if invalidos:
+        st.warning(f"⚠️ {len(invalidos)} edificio(s) con datos incompletos se omitieron: {', '.join(invalidos[:10])}"
+                   + (" ..." if len(invalidos) > 10 else ""))
+    if lote.empty:
+        st.warning("⚠️ No hay edificios válidos en el archivo.")
+        return
+
+    st.success(f"✅ {n} edificios calculados.")
+    st.dataframe(resumen, use_container_width=True)
+    if calculado["xlsx"] is not None:
+        st.download_button(
+            "📥 Descargar Resultados (.xlsx)", calculado["xlsx"], "resultados_lote_viento.xlsx",
+            "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+        )
+
+    # --- REPORTES PDF DEL PORTAFOLIO ---
+    st.markdown("---")
+    st.subheader("Reportes PDF del Portafolio")
+    procesos = st.number_input("Procesos en paralelo", min_value=1, max_value=os.cpu_count() or 1,
+                               value=min(4, os.cpu_count() or 1))
+    if st.button("📄 Generar Reportes PDF (.zip)"):
+        import reporte
+
+        # Cada PDF se escribe a disco en su propio proceso; el zip se arma desde los archivos
+        try:
+            with tempfile.TemporaryDirectory() as carpeta:
+                with st.spinner(f"Generando {n} reportes..."):
+                    rutas, fallidos = reporte.generar_reportes_viento(
+                        trabajos_reportes_lote(lote, resumen, pisos, carpeta), procesos=int(procesos)
+                    )
+                    ruta_zip = os.path.join(carpeta, "reportes_viento.zip")
+                    with zipfile.ZipFile(ruta_zip, "w", zipfile.ZIP_DEFLATED) as zf:
+                        for ruta in rutas:
+                            zf.write(ruta, os.path.basename(ruta))
+                            os.remove(ruta)
+                # st.download_button necesita el contenido completo en memoria
+                with open(ruta_zip, "rb") as f:
+                    calculado["zip"] = f.read()
+                calculado["zip_fallidos"] = fallidos
+        except Exception as e:
+            st.error(f"Error al generar los reportes: {e}")
+    if calculado.get("zip_fallidos"):
+        fallidos = calculado["zip_fallidos"]
+        st.warning(f"⚠️ {len(fallidos)} reporte(s) no se pudieron generar y no están en el zip:")
+        st.dataframe(pd.DataFrame(fallidos, columns=["Edificio", "Error"]), use_container_width=True, hide_index=True)
+    if "zip" in calculado:
+        st.download_button("📥 Descargar Reportes (.zip)", calculado["zip"], "reportes_viento.zip", "application/zip")
+
+def app_viento():
+    st.title("🌪️ Análisis de Cargas de Viento (RNC-07)")
+    st.markdown("""
+    Cálculo de fuerzas estáticas según el **Título IV del Reglamento Nacional de Construcción**.
+    *(Fórmula: $P_z = 0.0479 \cdot C_p \cdot V_D^2$)*
+    """)
+
+    modo = st.sidebar.radio("Modo de Cálculo", ["Edificio Individual", "Lote desde Archivo (XLSX/CSV)"])
+    if modo != "Edificio Individual":
+        app_viento_lote()
+        return
+
+    # --- INPUTS VIENTO ---
+    with st.sidebar:
+        st.subheader("1. Geometría del Edificio")
+        B = st.number_input("Ancho Frontal B (m)", value=20.0, min_value=1.0)
+        L = st.number_input("Profundidad L (m)", value=15.0, min_value=1.0)
+        alturas_input = st.text_area("Alturas de Entrepisos (m)", value="4.0, 3.5, 3.5, 3.5")
+        
+        st.subheader("2. Parámetros RNC-07")
+        zona_opt = st.selectbox("Zona Eólica (Fig. 7)", ["Zona 1 (Norte/Centro)", "Zona 2 (Pacífico/Managua)", "Zona 3 (Atlántico)"])
+        grupo_opt = st.selectbox("Importancia (Art. 50)", ["Grupo A (Esencial - 200 años)", "Grupo B (Normal - 50 años)"])
+        rugosidad_opt = st.selectbox("Rugosidad (Tabla 6)", ["R1 (Campo Abierto)", "R2 (Pocas obstrucciones)", "R3 (Urbano)", "R4 (Centro denso)"])
+        topo_opt = st.selectbox("Topografía (Tabla 7)", ["T1 (Protegida)", "T2 (Valles)", "T3 (Plano < 5%)", "T4 (Pendiente 5-10%)", "T5 (Cimas > 10%)"])
+
+        # ---  DOCUMENTOS  ---
+        st.markdown("---")
+        st.markdown("### 📚 Documentación Oficial")
+
+#  RNC-07         
+        try: 
+            with open("RNC-07.pdf", "rb") as f:
+                pdf_data_rnc = f.read()
+            
+            st.download_button(
+                label="📘 Descargar RNC-07 (PDF)",
+                data=pdf_data_rnc,
+                file_name="Reglamento_Nacional_Construccion_2007.pdf",
+                mime="application/pdf"
+            )
+        except:
+            pass
+
+#  MANUAL DE USUARIO 
+        try:
+            with open("Manual de Usuario NICSPECTRA.pdf", "rb") as f:
+                pdf_manual = f.read()
+            st.download_button(
+                label="📕 Descargar Manual de Usuario",
+                data=pdf_manual,
+                file_name="Manual_Usuario_NICSPECTRA.pdf",
+                mime="application/pdf"
+            )
+        except:
+            pass
+
+
+    # --- CÁLCULOS VIENTO ---
+    try:
+        h_pisos = [float(x.strip()) for x in alturas_input.split(',') if x.strip()]
+        if not h_pisos:
+            st.warning("⚠️ Ingresa al menos una altura de entrepiso.")
+            return
+
+        entradas_viento = {
+            "modulo": "viento", "B": B, "L": L, "h_pisos": h_pisos,
+            "zona": zona_opt, "grupo": grupo_opt, "rugosidad": rugosidad_opt, "topografia": topo_opt
+        }
+        clave_viento = almacen.clave_resultado(entradas_viento)
+        cache = almacen.obtener_json(clave_viento, "tabla_viento")
+
+        if cache is None:
+            calculo = calcular_viento(B, L, h_pisos, zona_opt, grupo_opt, rugosidad_opt, topo_opt)
+            if calculo is None: return
+            Vr, sum_fx, sum_fy, resultados = calculo
+            almacen.guardar_json(clave_viento, "tabla_viento",
+                                 {"Vr": Vr, "sum_fx": sum_fx, "sum_fy": sum_fy, "resultados": resultados})
+        else:
+            Vr, sum_fx, sum_fy, resultados = cache["Vr"], cache["sum_fx"], cache["sum_fy"], cache["resultados"]
+
+        col1, col2, col3 = st.columns(3)
+        col1.metric("Velocidad Regional", f"{Vr} m/s")
+        col2.metric("Cortante FX", f"{sum_fx:.2f} Ton")
+        col3.metric("Cortante FY", f"{sum_fy:.2f} Ton")
+
+        df = pd.DataFrame(resultados)
+        st.subheader("Tabla de Cargas")
+        st.dataframe(df, use_container_width=True)
+
+        opcion_descarga = st.selectbox(
+            "Seleccione el formato a descargar:",
+            ["Tabla (.csv)", "Reporte PDF (.pdf)"]
+        )
+
+        if opcion_descarga == "Tabla (.csv)":
+            st.download_button("📥 Descargar CSV", df.to_csv(index=False).encode('utf-8'), "cargas_viento.csv", "text/csv")
+
+        elif opcion_descarga == "Reporte PDF (.pdf)":
+            # La fecha va en el pie de página, por eso forma parte de la clave
+            clave_pdf = almacen.clave_resultado({"viento": clave_viento, "fecha": datetime.now().strftime("%d/%m/%Y")})
+            pdf_bytes = almacen.obtener(clave_pdf, "pdf_viento")
+            if pdf_bytes is None:
+                import reporte
+
+                datos_pdf = {
+                    "B": B, "L": L, "H": sum(h_pisos),
+                    "zona": zona_opt, "grupo": grupo_opt, "rugosidad": rugosidad_opt, "topografia": topo_opt,
+                    "Vr": Vr, "sum_fx": sum_fx, "sum_fy": sum_fy
+                }
+                # El PDF se escribe a disco, pero st.download_button necesita los bytes
+                # completos: en la página interactiva el reporte termina en memoria igual
+                with tempfile.TemporaryDirectory() as carpeta:
+                    ruta_pdf = reporte.generar_pdf_viento(
+                        datos_pdf, resultados, reporte.grafico_perfil_presion(resultados),
+                        os.path.join(carpeta, "reporte_viento.pdf")
+                    )
+                    with open(ruta_pdf, "rb") as f:
+                        pdf_bytes = f.read()
+                almacen.guardar(clave_pdf, "pdf_viento", pdf_bytes)
+
+            st.download_button(
+                label="📄 Descargar Reporte PDF",
+                data=pdf_bytes,
+                file_name="Reporte_Viento_RNC07.pdf",
+                mime="application/pdf"
+            )
+
+        # --- COMBINACIONES DE CARGA ---
+        st.markdown("---")
+        st.subheader("Combinaciones de Carga por Piso")
+        if st.checkbox("Combinar viento con cargas gravitacionales y ceniza"):
+            import combinaciones
+
+            col_g1, col_g2, col_g3, col_g4 = st.columns(4)
+            CM = col_g1.number_input("Carga Muerta CM (kg/m²)", value=500.0, min_value=0.0)
+            CV = col_g2.number_input("Carga Viva Entrepiso CV (kg/m²)", value=250.0, min_value=0.0)
+            CVR = col_g3.number_input("Carga Viva Techo CVR (kg/m²)", value=100.0, min_value=0.0)
+            # El módulo de sismo guarda la carga de ceniza del sitio seleccionado
+            Ccv = col_g4.number_input("Carga Ceniza Ccv (kg/m²)", min_value=0.0,
+                                      value=float(st.session_state.get('carga_ceniza', 0.0)),
+                                      help="Se toma del módulo de Sismo (NSM-22 Sec. 7.3) si ya fue calculada.")
+
+            # Cargas por piso (Ton): pesos sobre el área B x L y fuerzas laterales de viento.
+            # CV actúa en los entrepisos; CVR y Ccv solo en el techo (último piso).
+            area = B * L / 1000
+            n_pisos = len(resultados)
+            solo_techo = [0.0] * (n_pisos - 1)
+            cargas_piso = pd.DataFrame({
+                "CM": [CM * area] * n_pisos,
+                "CV": [CV * area] * (n_pisos - 1) + [0.0],
+                "CVR": solo_techo + [CVR * area],
+                "Ccv": solo_techo + [Ccv * area],
+                "Wx": [r["Fx (Ton)"] for r in resultados],
+                "Wy": [r["Fy (Ton)"] for r in resultados],
+            }, index=[r["Nivel"] for r in resultados])
+            cargas_piso = st.data_editor(cargas_piso, use_container_width=True, key="cargas_piso")
+
+            # Efectos de entrepiso por componente: P (axial acumulada), Vx y Vy (cortantes)
+            nombres_comb, matriz = combinaciones.matriz_combinaciones(combinaciones.CASOS)
+            efectos = combinaciones.efectos_por_componente(cargas_piso[combinaciones.CASOS].to_numpy())
+            combinadas = combinaciones.combinar_cargas(efectos, matriz)
+            maximo, minimo, idx_max, idx_min = combinaciones.envolventes(combinadas)
+
+            columnas_env = {}
+            for k, comp in enumerate(combinaciones.COMPONENTES):
+                columnas_env[f"{comp} máx (Ton)"] = maximo[:, k].round(3)
+                columnas_env[f"{comp} comb. máx"] = [nombres_comb[i] for i in idx_max[:, k]]
+                columnas_env[f"{comp} mín (Ton)"] = minimo[:, k].round(3)
+                columnas_env[f"{comp} comb. mín"] = [nombres_comb[i] for i in idx_min[:, k]]
+            df_env = pd.DataFrame(columnas_env, index=cargas_piso.index)
+            st.markdown("**Envolvente por entrepiso** (P: carga axial acumulada; Vx, Vy: cortante de entrepiso)")
+            st.dataframe(df_env, use_container_width=True)
+
+            with st.expander("Ver todas las combinaciones"):
+                comp_sel = st.selectbox("Componente", combinaciones.COMPONENTES)
+                k = combinaciones.COMPONENTES.index(comp_sel)
+                st.dataframe(pd.DataFrame(combinadas[:, k, :].round(3), index=cargas_piso.index, columns=nombres_comb),
+                             use_container_width=True)
+            st.download_button("📥 Descargar Envolvente CSV", df_env.to_csv().encode('utf-8'),
+                               "envolvente_combinaciones.csv", "text/csv")
+
+        # --- PRESIONES EN FACHADA (REVESTIMIENTOS) ---
+        st.markdown("---")
+        st.subheader("Presiones en Fachada (Revestimientos y Vidrios)")
+        if st.checkbox("Calcular mapa de presiones por panel"):
+            import presiones_fachada
+
+            col_p1, col_p2 = st.columns(2)
+            ancho_panel = col_p1.number_input("Ancho de panel (m)", value=1.5, min_value=0.1)
+            alto_panel = col_p2.number_input("Alto de panel (m)", value=1.5, min_value=0.1)
+
+            clave_fachada = almacen.clave_resultado(
+                {**entradas_viento, "ancho_panel": ancho_panel, "alto_panel": alto_panel}
+            )
+            npz_fachada = almacen.obtener(clave_fachada, "fachada_npz")
+            img_fachada = almacen.obtener(clave_fachada, "fachada_png")
+
+            if npz_fachada is None or img_fachada is None:
+                Vr, alpha, delta, Ftr = parametros_viento(zona_opt, grupo_opt, rugosidad_opt, topo_opt)
+                H_total = sum(h_pisos)
+                fachada = presiones_fachada.calcular_presiones_fachada(
+                    B, L, H_total, Vr, alpha, delta, Ftr, ancho_panel, alto_panel
+                )
+                npz_fachada = presiones_fachada.exportar_npz(fachada)
+                img_fachada = presiones_fachada.mapa_calor_png(fachada, B, L, H_total)
+                almacen.guardar(clave_fachada, "fachada_npz", npz_fachada)
+                almacen.guardar(clave_fachada, "fachada_png", img_fachada)
+            else:
+                fachada = presiones_fachada.leer_npz(npz_fachada)
+
+            caras = list(presiones_fachada.CARAS)
+            n_paneles = sum(fachada[f"{c}_max"].size for c in caras)
+            c1, c2, c3 = st.columns(3)
+            c1.metric("Paneles", f"{n_paneles:,}")
+            c2.metric("Presión máxima", f"{max(float(fachada[f'{c}_max'].max()) for c in caras):.2f} kg/m²")
+            c3.metric("Succión máxima", f"{min(float(fachada[f'{c}_min'].min()) for c in caras):.2f} kg/m²")
+            st.caption("Envolvente sobre las cuatro direcciones de viento normales a las caras.")
+
+            st.image(img_fachada, use_container_width=True)
+            col_d1, col_d2 = st.columns(2)
+            col_d1.download_button("📥 Descargar Presiones (.npz)", npz_fachada,
+                                   "presiones_fachada.npz", "application/octet-stream")
+            col_d2.download_button("🖼️ Descargar Mapa de Calor (.png)", img_fachada,
+                                   "presiones_fachada.png", "image/png")
+
+    except Exception as e:
+        st.error(f"Error: {e}")
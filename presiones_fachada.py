@@ -0,0 +1,143 @@
+"""
+Presiones de viento sobre paneles de fachada (revestimientos y vidrios).
+
+Divide las cuatro caras del edificio en una malla de paneles y calcula la
+presión de diseño de cada uno con P = 0.0479 · Cp · Vd² (RNC-07). Vd(z) se
+evalúa una sola vez por fila de paneles (altura única) y se propaga a todas
+las columnas con NumPy, de modo que cientos de miles de paneles se resuelven
+en pocas operaciones vectorizadas.
+
+Cada cara física es barlovento, sotavento o lateral según la dirección del
+viento; el resultado es la envolvente (presión máxima y succión máxima) de
+cada panel sobre las cuatro direcciones normales a las caras.
+"""
+import io
+
+import numpy as np
+
+from rnc07 import K_PRESION, velocidad_diseno
+
+# ----------------------------------------------------------------------------
+# CONSTANTES
+# ----------------------------------------------------------------------------
+# Coeficientes de presión exterior según la posición de la cara respecto al
+# viento (+ presión, - succión)
+CP_CARAS = {
+    "Barlovento": 0.8,
+    "Sotavento": -0.4,
+    "Lateral": -0.7,
+}
+
+# Caras físicas: ancho en planta (B o L) y cara opuesta. El viento sopla
+# normal a cada una de ellas por turno.
+CARAS = {"B1": "B", "B2": "B", "L1": "L", "L2": "L"}
+OPUESTA = {"B1": "B2", "B2": "B1", "L1": "L2", "L2": "L1"}
+
+# Factores de presión local en bordes verticales/superiores y en esquinas.
+# Amplifican solo la succión (Cp < 0); la presión positiva de barlovento se
+# usa sin amplificar.
+FACTOR_BORDE = 1.5
+FACTOR_ESQUINA = 2.0
+
+
+# ----------------------------------------------------------------------------
+# 1. MOTOR DE CÁLCULO
+# ----------------------------------------------------------------------------
+def posicion_cara(cara, direccion):
+    """Posición de la cara ('Barlovento', 'Sotavento' o 'Lateral') con viento normal a `direccion`."""
+    if cara == direccion:
+        return "Barlovento"
+    if cara == OPUESTA[direccion]:
+        return "Sotavento"
+    return "Lateral"
+
+
+def calcular_presiones_fachada(B, L, H, Vr, alpha, delta, Ftr, ancho_panel, alto_panel):
+    """
+    Envolvente de presión de diseño (kg/m²) en cada panel de las cuatro caras.
+
+    Devuelve un diccionario con 'z' (altura del centro de cada fila), 'x_B' y
+    'x_L' (centro de cada columna en caras de ancho B y L) y, por cada cara de
+    CARAS, los arreglos (filas, columnas) en float32 '<cara>_max' (presión
+    máxima) y '<cara>_min' (succión máxima) sobre las cuatro direcciones.
+    """
+    n_filas = int(np.ceil(H / alto_panel))
+    z = np.minimum((np.arange(n_filas) + 0.5) * alto_panel, H)
+
+    # Barlovento varía con z; sotavento y laterales usan Vd a la altura total
+    q_z = K_PRESION * velocidad_diseno(z, Vr, alpha, delta, Ftr) ** 2
+    q_H = K_PRESION * float(velocidad_diseno(H, Vr, alpha, delta, Ftr)) ** 2
+
+    # Ancho de la zona de borde
+    a = min(0.1 * min(B, L), 0.4 * H)
+    borde_z = z > H - a
+
+    resultado = {"z": z}
+    for cara, lado in CARAS.items():
+        ancho = B if lado == "B" else L
+        n_cols = int(np.ceil(ancho / ancho_panel))
+        x = np.minimum((np.arange(n_cols) + 0.5) * ancho_panel, ancho)
+        borde_x = (x < a) | (x > ancho - a)
+        resultado[f"x_{lado}"] = x
+
+        factor = np.where(
+            borde_z[:, None] & borde_x[None, :], FACTOR_ESQUINA,
+            np.where(borde_z[:, None] | borde_x[None, :], FACTOR_BORDE, 1.0)
+        )
+
+        # Presión de la cara para cada dirección de viento: (direcciones, filas, columnas)
+        presiones = []
+        for direccion in CARAS:
+            posicion = posicion_cara(cara, direccion)
+            cp = CP_CARAS[posicion]
+            q = q_z if posicion == "Barlovento" else np.full(n_filas, q_H)
+            f = factor if cp < 0 else 1.0
+            presiones.append(cp * f * np.broadcast_to(q[:, None], factor.shape))
+        presiones = np.stack(presiones)
+
+        resultado[f"{cara}_max"] = presiones.max(axis=0).astype(np.float32)
+        resultado[f"{cara}_min"] = presiones.min(axis=0).astype(np.float32)
+
+    return resultado
+
+
+# ----------------------------------------------------------------------------
+# 2. EXPORTACIÓN
+# ----------------------------------------------------------------------------
+def exportar_npz(resultado):
+    """Arreglos comprimidos (.npz) listos para descargar."""
+    buf = io.BytesIO()
+    np.savez_compressed(buf, **resultado)
+    return buf.getvalue()
+
+
+def leer_npz(datos):
+    """Inverso de exportar_npz: bytes .npz a diccionario de arreglos."""
+    with np.load(io.BytesIO(datos), allow_pickle=False) as npz:
+        return {k: npz[k] for k in npz.files}
+
+
+def mapa_calor_png(resultado, B, L, H):
+    """Mapa de calor de la envolvente de las cuatro caras (presión arriba, succión abajo) en PNG."""
+    import matplotlib.pyplot as plt
+    from matplotlib.colors import TwoSlopeNorm
+
+    p_min = min(float(resultado[f"{c}_min"].min()) for c in CARAS)
+    p_max = max(float(resultado[f"{c}_max"].max()) for c in CARAS)
+    norm = TwoSlopeNorm(vmin=min(p_min, -1e-6), vcenter=0.0, vmax=max(p_max, 1e-6))
+
+    fig, axes = plt.subplots(2, len(CARAS), figsize=(4 * len(CARAS), 10), sharey=True, squeeze=False)
+    for fila, (sufijo, titulo) in enumerate([("max", "presión máx."), ("min", "succión máx.")]):
+        for ax, (cara, lado) in zip(axes[fila], CARAS.items()):
+            ancho = B if lado == "B" else L
+            im = ax.imshow(resultado[f"{cara}_{sufijo}"], origin="lower", aspect="auto", cmap="RdBu_r", norm=norm,
+                           extent=(0, ancho, 0, H), interpolation="nearest")
+            ax.set_title(f"Cara {cara} ({titulo})")
+            ax.set_xlabel("Ancho (m)")
+        axes[fila][0].set_ylabel("Altura (m)")
+    fig.colorbar(im, ax=axes, label="Presión (kg/m²)")
+
+    buf = io.BytesIO()
+    fig.savefig(buf, format="png", dpi=150, bbox_inches="tight")
+    plt.close(fig)
+    return buf.getvalue()
@@ -0,0 +1,250 @@
+"""
+Reportes PDF de NICSPECTRA.
+"""
+from fpdf import FPDF
+import io
+import os
+import tempfile
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from datetime import datetime
+
+# ----------------------------------------------------------------------------
+# 1. Reporte PDF 
+# ----------------------------------------------------------------------------
+class PDFReport(FPDF):
+    def header(self):
+        try:
+            self.image('logo_nicspectra.jpg', 10, 8, 20)
+        except:
+            pass
+        self.set_font('Arial', 'B', 15)
+        self.cell(80)
+        self.cell(30, 10, 'NICSPECTRA - Reporte de Cálculo', 0, 0, 'C')
+        self.ln(20)
+
+    def footer(self):
+        self.set_y(-15)
+        self.set_font('Arial', 'I', 8)
+        self.cell(0, 10, f'Página {self.page_no()} - {datetime.now().strftime("%d/%m/%Y")}', 0, 0, 'C')
+
+def generar_pdf_sismo(datos, img_png):
+    pdf = PDFReport()
+    pdf.add_page()
+    pdf.set_auto_page_break(auto=True, margin=15)
+    
+    # Título
+    pdf.set_font('Arial', 'B', 12)
+    pdf.cell(0, 10, f'Módulo: Sismo (NSM-22) - {datos["departamento"]}', 0, 1, 'L')
+    pdf.ln(5)
+
+    # Tabla de Datos
+    pdf.set_font('Arial', 'B', 10)
+    pdf.set_fill_color(220, 230, 255)
+    pdf.cell(0, 8, "Resumen de Parámetros y Resultados", 1, 1, 'L', fill=True)
+    pdf.set_font('Arial', '', 10)
+    
+    # Lista de valores a imprimir
+    items = [
+        ("Ubicación", datos['departamento']),
+        ("Aceleración (a0)", f"{datos['a0']:.4f} g"),
+        ("Tipo de Suelo", f"{datos['suelo']} (Vs30: {datos['vs30']})"),
+        ("Grupo Importancia", f"{datos['grupo']} (I={datos['I']})"),
+        ("Categoría Diseño", datos['cds']),
+        ("Sistema Estructural", datos['sistema']),
+        ("R (Sistema)", f"{datos['R']}"),
+        ("Irreg. Planta (Phi_P)", f"{datos['Phi_P']:.2f}"),
+        ("Irreg. Elevación (Phi_E)", f"{datos['Phi_E']:.2f}"),
+        ("R0 (Reducido)", f"{datos['Ro']:.2f}"),
+        ("Aceleración Diseño (A0)", f"{datos['A0']:.4f} g"),
+        ("Carga Ceniza (Ccv)", f"{datos['Ccv']} kg/m²")
+    ]
+    
+    for k, v in items:
+        pdf.cell(95, 8, k, 1)
+        pdf.cell(95, 8, str(v), 1, 1)
+        
+    pdf.ln(10)
+    
+    # Pegar Gráfico
+    pdf.set_font('Arial', 'B', 10)
+    pdf.cell(0, 8, "Espectro de Diseño", 0, 1, 'L')
+    ruta_img = None
+    try:
+        with tempfile.NamedTemporaryFile(delete=False, suffix=".png") as tmpfile:
+            tmpfile.write(img_png)
+            ruta_img = tmpfile.name
+        pdf.image(ruta_img, x=10, w=180)
+    except Exception as e:
+        pdf.cell(0, 10, f"Error al generar gráfico: {str(e)}", 0, 1)
+    finally:
+        if ruta_img:
+            os.remove(ruta_img)
+        
+    return pdf.output(dest='S').encode('latin-1')
+
+# ----------------------------------------------------------------------------
+# 2. Reporte PDF de Viento
+# ----------------------------------------------------------------------------
+COLUMNAS_VIENTO = [
+    ("Nivel", 26),
+    ("Z (m)", 26),
+    ("Fa", 24),
+    ("Vd (m/s)", 28),
+    ("q_neto (kg/m²)", 30),
+    ("Fx (Ton)", 28),
+    ("Fy (Ton)", 28),
+]
+
+def grafico_perfil_presion(resultados):
+    """Perfil de presión neta q_neto vs altura Z en PNG."""
+    import matplotlib.pyplot as plt
+
+    z = [float(r["Z (m)"]) for r in resultados]
+    q = [float(r["q_neto (kg/m²)"]) for r in resultados]
+
+    fig, ax = plt.subplots(figsize=(6, 5))
+    ax.plot(q, z, 'b-o', linewidth=2, markersize=3)
+    ax.set_title("Perfil de Presión Neta (RNC-07)", fontsize=12)
+    ax.set_xlabel("q_neto (kg/m²)"); ax.set_ylabel("Altura Z (m)")
+    ax.set_ylim(0, max(z) * 1.05)
+    ax.grid(linestyle='--', linewidth=0.7, alpha=0.8)
+
+    buf = io.BytesIO()
+    fig.savefig(buf, format="png", dpi=150, bbox_inches='tight')
+    plt.close(fig)
+    return buf.getvalue()
+
+def _latin1(texto):
+    """fpdf 1.7 solo admite latin-1: los caracteres fuera de él se reemplazan por '?'."""
+    return str(texto).encode('latin-1', 'replace').decode('latin-1')
+
+def _encabezado_tabla_viento(pdf):
+    pdf.set_font('Arial', 'B', 9)
+    pdf.set_fill_color(220, 230, 255)
+    for clave, ancho in COLUMNAS_VIENTO:
+        pdf.cell(ancho, 7, clave, 1, 0, 'C', fill=True)
+    pdf.ln()
+    pdf.set_font('Arial', '', 9)
+
+def generar_pdf_viento(datos, resultados, img_perfil, destino):
+    """
+    Escribe el reporte de viento directamente en el archivo `destino`.
+    La tabla de pisos se pagina repitiendo el encabezado en cada hoja.
+    """
+    pdf = PDFReport()
+    pdf.set_auto_page_break(auto=False)
+    pdf.add_page()
+
+    # Título
+    pdf.set_font('Arial', 'B', 12)
+    pdf.cell(0, 10, _latin1(f'Módulo: Viento (RNC-07) - {datos.get("nombre", "Edificio")}'), 0, 1, 'L')
+    pdf.ln(5)
+
+    # Tabla de Datos
+    pdf.set_font('Arial', 'B', 10)
+    pdf.set_fill_color(220, 230, 255)
+    pdf.cell(0, 8, "Resumen de Parámetros y Resultados", 1, 1, 'L', fill=True)
+    pdf.set_font('Arial', '', 10)
+
+    items = [
+        ("Geometría (B x L)", f"{datos['B']:.2f} m x {datos['L']:.2f} m"),
+        ("Altura Total (H)", f"{datos['H']:.2f} m ({len(resultados)} pisos)"),
+        ("Zona Eólica", datos['zona']),
+        ("Importancia", datos['grupo']),
+        ("Rugosidad", datos['rugosidad']),
+        ("Topografía", datos['topografia']),
+        ("Velocidad Regional (Vr)", f"{datos['Vr']} m/s"),
+        ("Cortante FX", f"{datos['sum_fx']:.2f} Ton"),
+        ("Cortante FY", f"{datos['sum_fy']:.2f} Ton")
+    ]
+
+    # Los datos del lote vienen de la hoja del usuario y pueden traer cualquier carácter
+    for k, v in items:
+        pdf.cell(95, 8, k, 1)
+        pdf.cell(95, 8, _latin1(v), 1, 1)
+
+    pdf.ln(10)
+
+    # Pegar Gráfico
+    pdf.set_font('Arial', 'B', 10)
+    pdf.cell(0, 8, "Perfil de Presión", 0, 1, 'L')
+    ruta_img = None
+    try:
+        with tempfile.NamedTemporaryFile(delete=False, suffix=".png") as tmpfile:
+            tmpfile.write(img_perfil)
+            ruta_img = tmpfile.name
+        pdf.image(ruta_img, x=45, w=120)
+    except Exception as e:
+        pdf.cell(0, 10, f"Error al generar gráfico: {str(e)}", 0, 1)
+    finally:
+        if ruta_img:
+            os.remove(ruta_img)
+
+    # Tabla de pisos paginada
+    pdf.add_page()
+    pdf.set_font('Arial', 'B', 10)
+    pdf.cell(0, 8, "Tabla de Cargas por Piso", 0, 1, 'L')
+    _encabezado_tabla_viento(pdf)
+    limite_y = pdf.h - 20
+    for r in resultados:
+        if pdf.get_y() + 6 > limite_y:
+            pdf.add_page()
+            _encabezado_tabla_viento(pdf)
+        for clave, ancho in COLUMNAS_VIENTO:
+            pdf.cell(ancho, 6, _latin1(r[clave]), 1, 0, 'C')
+        pdf.ln()
+
+    pdf.output(destino, 'F')
+    return destino
+
+def _tarea_reporte_viento(trabajo):
+    """Devuelve (ruta, None) o (None, (nombre, error)) para no detener el lote por un edificio."""
+    datos, resultados, destino = trabajo
+    try:
+        return generar_pdf_viento(datos, resultados, grafico_perfil_presion(resultados), destino), None
+    except Exception as e:
+        if os.path.exists(destino):
+            os.remove(destino)
+        return None, (str(datos.get("nombre", "Edificio")), f"{type(e).__name__}: {e}")
+
+# Reportes por proceso antes de reciclarlo: libera la memoria acumulada sin
+# pagar la carga de fpdf y matplotlib en cada reporte
+TAREAS_POR_PROCESO = 50
+# Tareas en vuelo por proceso: limita cuántos trabajos se leen del iterable
+TAREAS_EN_VUELO = 2
+
+def generar_reportes_viento(trabajos, procesos=None):
+    """
+    Genera en lote los reportes de viento de un portafolio de edificios.
+    trabajos: iterable (p. ej. un generador) de (datos, resultados, destino).
+    Cada reporte se escribe a disco en un proceso del pool; los procesos se
+    reemplazan cada TAREAS_POR_PROCESO reportes. Los trabajos se envían en una
+    ventana acotada, así el proceso principal solo retiene unos pocos
+    edificios a la vez. Devuelve (rutas, fallidos): las rutas generadas en el
+    orden de los trabajos y una lista de (nombre, error) de los edificios cuyo
+    reporte no se pudo generar.
+    """
+    if procesos == 1:
+        return _separar_fallidos(_tarea_reporte_viento(t) for t in trabajos)
+    procesos = procesos or os.cpu_count() or 1
+    rutas = {}
+    with ProcessPoolExecutor(max_workers=procesos, max_tasks_per_child=TAREAS_POR_PROCESO) as pool:
+        pendientes = {}
+        for i, trabajo in enumerate(trabajos):
+            if len(pendientes) >= procesos * TAREAS_EN_VUELO:
+                hechos, _ = wait(pendientes, return_when=FIRST_COMPLETED)
+                for futuro in hechos:
+                    rutas[pendientes.pop(futuro)] = futuro.result()
+            pendientes[pool.submit(_tarea_reporte_viento, trabajo)] = i
+        for futuro in wait(pendientes).done:
+            rutas[pendientes[futuro]] = futuro.result()
+    return _separar_fallidos(rutas[i] for i in sorted(rutas))
+
+def _separar_fallidos(salidas):
+    rutas, fallidos = [], []
+    for ruta, error in salidas:
+        if error is None:
+            rutas.append(ruta)
+        else:
+            fallidos.append(error)
+    return rutas, fallidos
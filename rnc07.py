@@ -0,0 +1,36 @@
+"""
+Parámetros y fórmulas de viento del RNC-07 compartidos por NICSPECTRA.
+
+Sin dependencias de streamlit: lo usan el cálculo por piso y en lote de
+modulo_viento y las presiones de fachada. Las funciones aceptan escalares o
+arreglos de NumPy (con broadcasting).
+"""
+import numpy as np
+
+# ----------------------------------------------------------------------------
+# CONSTANTES
+# ----------------------------------------------------------------------------
+# Velocidad regional Vr (m/s) por zona y grupo
+TABLA_VR = {1: {'A': 36, 'B': 30}, 2: {'A': 60, 'B': 45}, 3: {'A': 70, 'B': 56}}
+# Exponente alpha y altura gradiente delta (m) por rugosidad
+TABLA_RUG = {'R1': {'a': 0.099, 'd': 245}, 'R2': {'a': 0.128, 'd': 315}, 'R3': {'a': 0.156, 'd': 390}, 'R4': {'a': 0.170, 'd': 455}}
+# Factor de topografía Ftr por topografía y rugosidad (R1 usa 1.0)
+TABLA_FTR = {'T1': {'R2': 0.8, 'R3': 0.70, 'R4': 0.66}, 'T2': {'R2': 0.9, 'R3': 0.79, 'R4': 0.74},
+             'T3': {'R2': 1.0, 'R3': 0.88, 'R4': 0.82}, 'T4': {'R2': 1.1, 'R3': 0.97, 'R4': 0.90}, 'T5': {'R2': 1.2, 'R3': 1.06, 'R4': 0.98}}
+
+# P = K_PRESION · Cp · Vd² (kg/m², Vd en m/s)
+K_PRESION, CP_BARLO, CP_SOTA = 0.0479, 0.8, 0.4
+
+
+# ----------------------------------------------------------------------------
+# 1. FÓRMULAS
+# ----------------------------------------------------------------------------
+def factor_altura(z, alpha, delta):
+    """Fa(z): 1.0 hasta 10 m, (z/10)^alpha hasta delta y constante arriba de delta."""
+    z = np.asarray(z, dtype=float)
+    return np.where(z > 10.0, (np.clip(z, 10.0, delta) / 10.0) ** alpha, 1.0)
+
+
+def velocidad_diseno(z, Vr, alpha, delta, Ftr):
+    """Vd(z) = Vr · Fa(z) · Ftr."""
+    return Vr * factor_altura(z, alpha, delta) * Ftr